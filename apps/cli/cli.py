@@ -23,6 +23,10 @@ import yaml
 TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates" / "project_template"
 PROJECTS_DIR = Path(__file__).parent.parent.parent / "projects"
 
+# Project slug patterns: drop punctuation, then fold space/hyphen runs
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[-\s]+')
+
 
 class NotInProjectError(Exception):
     """Raised when not in a GSD project directory."""
@@ -58,8 +62,8 @@ def generate_evidence_id() -> str:
 def slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '_', text)
+    text = _SLUG_STRIP_RE.sub('', text)
+    text = _SLUG_SEPARATOR_RE.sub('_', text)
     return text
 
 
@@ -309,7 +313,7 @@ def cmd_status(args: argparse.Namespace) -> int:
         print(f"Evidence: {len(evidence.get('evidence', {}))} blocks")
 
     if (build_dir / "disambiguation_queue.json").exists():
-        queue = json.loads((build_dir / "disambiguation_queue.json").read_text())
+        queue = json.loads((build_dir / "disambiguation_queue.json").read_text(encoding="utf-8"))
         open_items = len([i for i in queue.get('items', []) if i['status'] == 'open'])
         print(f"Disambiguation queue: {open_items} open items")
 
@@ -367,6 +371,8 @@ def cmd_build(args: argparse.Namespace) -> int:
         print(f"Scenes: {result.scenes_created} created")
         print(f"Vault notes: {result.vault_notes_written} written")
         print(f"Disambiguation items: {result.queue_items} queued")
+        if result.files_skipped:
+            print(f"Inbox files: {result.files_skipped} unchanged, skipped")
 
         if result.errors:
             print()
@@ -834,7 +840,7 @@ def cmd_resolve(args: argparse.Namespace) -> int:
         print("No disambiguation queue found. Run 'gsd build canon' first.")
         return 1
 
-    queue = json.loads(queue_path.read_text())
+    queue = json.loads(queue_path.read_text(encoding="utf-8"))
     open_items = [i for i in queue.get("items", []) if i["status"] == "open"]
 
     if not open_items:
@@ -912,7 +918,7 @@ def cmd_resolve(args: argparse.Namespace) -> int:
 def _apply_resolution(project_path: Path, item: dict):
     """Apply a disambiguation resolution."""
     storygraph_path = project_path / "build" / "storygraph.json"
-    storygraph = json.loads(storygraph_path.read_text())
+    storygraph = json.loads(storygraph_path.read_text(encoding="utf-8"))
 
     if item["recommended_action"] in ("merge", "link"):
         # Add alias to existing entity
@@ -960,7 +966,7 @@ def _create_entity_from_queue(project_path: Path, item: dict) -> dict:
         The created entity dict, or None if entity already exists.
     """
     storygraph_path = project_path / "build" / "storygraph.json"
-    storygraph = json.loads(storygraph_path.read_text())
+    storygraph = json.loads(storygraph_path.read_text(encoding="utf-8"))
 
     # Generate ID
     prefix_map = {"character": "CHAR", "location": "LOC"}
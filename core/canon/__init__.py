@@ -9,10 +9,19 @@ Wires together:
 """
 import hashlib
 import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..extraction import (
     CharacterExtractor,
@@ -27,6 +36,81 @@ from ..vault import VaultNoteWriter
 # Constants
 FUZZY_QUEUE_THRESHOLD = 50  # Minimum score to consider fuzzy match for queueing
 FUZZY_MERGE_THRESHOLD = 70  # Score at which we suggest merge vs link
+PARALLEL_EXTRACTION_MIN_BYTES = 256 * 1024  # Inbox bytes needed before extraction uses worker processes
+MAX_EXTRACTION_WORKERS = 8  # Upper bound on extraction worker processes
+EXTRACTION_VERSION = 1  # Bump when extractor changes alter what an unchanged inbox file yields
+
+
+def _slurp(path: Path) -> bytes:
+    """Read a whole file with raw descriptor reads, bypassing file objects."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        remaining = os.fstat(fd).st_size
+        while True:
+            # Size hint from fstat, then keep reading in case the file grew
+            chunk = os.read(fd, max(remaining, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Replace a file's contents with raw descriptor writes."""
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON build file, using orjson when available."""
+    data = _slurp(path)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_digest(path: Path) -> str:
+    """Hash an inbox file's content for change detection."""
+    return hashlib.blake2b(_slurp(path), digest_size=16).hexdigest()
+
+
+def _extract_candidates(
+    inbox_file: Path
+) -> Tuple[List[ExtractionCandidate], List[ExtractionCandidate]]:
+    """
+    Extract character and location candidates from one inbox file.
+
+    Runs in a worker process, so it uses fresh extractors. Their duplicate
+    tracking is keyed by file and line, which makes the result identical to
+    the builder's own extractors.
+    """
+    return (
+        CharacterExtractor().extract_from_file(inbox_file),
+        LocationExtractor().extract_from_file(inbox_file),
+    )
+
+
+def _scene_number(scene_id: str) -> int:
+    """Numeric part of a SCN_ id, or 0 if it has none."""
+    number = scene_id[4:]
+    return int(number) if number.isdigit() else 0
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write a JSON build file as UTF-8 with 2-space indentation."""
+    if ORJSON_AVAILABLE:
+        _write_file(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        _write_file(path, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
 
 
 @dataclass
@@ -40,6 +124,7 @@ class CanonBuildResult:
     scenes_created: int = 0
     queue_items: int = 0
     vault_notes_written: int = 0
+    files_skipped: int = 0
     errors: List[str] = field(default_factory=list)
 
 
@@ -69,9 +154,8 @@ class CanonBuilder:
 
         # Matcher
         disambig_config = self.config.get("disambiguation", {})
-        self.matcher = create_matcher(
-            threshold=disambig_config.get("fuzzy_threshold", 70)
-        )
+        self.fuzzy_threshold = disambig_config.get("fuzzy_threshold", 70)
+        self.matcher = create_matcher(threshold=self.fuzzy_threshold)
 
         # Config
         self.auto_accept_threshold = disambig_config.get("auto_accept", 0.95)
@@ -83,6 +167,9 @@ class CanonBuilder:
         # State
         self._entities: Dict[str, Dict] = {}  # canonical_id -> entity data
         self._queue_items: List[Dict] = []
+        self._free_scene_ids: deque = deque()  # ids of scenes dropped for rebuilt files
+        self._last_scene_num = 0  # highest scene number ever assigned
+        self._scenes_created = 0
 
     def build(self) -> CanonBuildResult:
         """
@@ -96,34 +183,54 @@ class CanonBuilder:
         # Load existing storygraph
         storygraph = self._load_storygraph()
 
+        # Skip inbox files whose content is unchanged since the last build
+        inbox_digests = {
+            self._inbox_key(inbox_file): _file_digest(inbox_file)
+            for inbox_file in sorted(self.inbox_path.glob("*.md"))
+        }
+        inbox_files = self._changed_inbox_files(storygraph, inbox_digests)
+        result.files_skipped = len(inbox_digests) - len(inbox_files)
+
+        # Scenes of changed files are detected again from their new content
+        self._drop_inbox_scenes(storygraph, inbox_files)
+
         # Load existing entities into matcher
         self._load_existing_entities(storygraph)
 
-        # Count existing scenes for accurate creation count
-        existing_scene_count = len([e for e in storygraph.get("entities", []) if e.get("type") == "scene"])
+        # Extract in worker processes; resolution below stays in file order
+        extracted: List[Any] = [None] * len(inbox_files)
+        workers = self._extraction_workers(inbox_files)
+        if workers > 1:
+            extracted = self._extract_in_workers(inbox_files, workers)
 
-        # Process each inbox file
-        inbox_files = list(self.inbox_path.glob("*.md"))
-
-        for inbox_file in inbox_files:
+        processed_files: List[Path] = []
+        for inbox_file, candidates in zip(inbox_files, extracted):
             try:
-                file_result = self._process_inbox_file(inbox_file)
+                if isinstance(candidates, Exception):
+                    raise candidates
+                file_result = self._process_inbox_file(inbox_file, candidates)
                 result.characters_created += file_result.get("chars_created", 0)
                 result.characters_linked += file_result.get("chars_linked", 0)
                 result.locations_created += file_result.get("locs_created", 0)
                 result.locations_linked += file_result.get("locs_linked", 0)
                 result.scenes_created += file_result.get("scenes_created", 0)
+                processed_files.append(inbox_file)
             except Exception as e:
                 result.errors.append(f"Error processing {inbox_file}: {str(e)}")
+                # Leave it out of the index so the next build retries it
+                del inbox_digests[self._inbox_key(inbox_file)]
 
         # Generate scene IDs for boundaries
-        self._process_scene_boundaries(inbox_files)
+        self._process_scene_boundaries(processed_files)
 
-        # Count newly created scenes
-        new_scene_count = len([e for e in self._entities.values() if e.get("type") == "scene"])
-        result.scenes_created = new_scene_count - existing_scene_count
+        # Count scenes given a new ID (rebuilt scenes keep theirs)
+        result.scenes_created = self._scenes_created
 
         # Update storygraph
+        storygraph["inbox_index"] = {
+            key: {"blake2b": inbox_digests[key]} for key in sorted(inbox_digests)
+        }
+        storygraph["inbox_fingerprint"] = self._inbox_fingerprint()
         self._update_storygraph(storygraph)
 
         # Write vault notes
@@ -135,12 +242,56 @@ class CanonBuilder:
 
         return result
 
+    def _extraction_workers(self, inbox_files: List[Path]) -> int:
+        """
+        Choose how many worker processes extract the inbox.
+
+        Workers only pay off once there is enough text to outweigh starting
+        them and sending candidates back, and never beyond the CPU count.
+
+        Args:
+            inbox_files: Inbox files to extract
+
+        Returns:
+            Number of workers, or 1 to extract in this process
+        """
+        workers = min(MAX_EXTRACTION_WORKERS, len(inbox_files), os.cpu_count() or 1)
+        if workers < 2:
+            return 1
+
+        inbox_bytes = sum(inbox_file.stat().st_size for inbox_file in inbox_files)
+        if inbox_bytes < PARALLEL_EXTRACTION_MIN_BYTES:
+            return 1
+        return workers
+
+    def _extract_in_workers(self, inbox_files: List[Path], workers: int) -> List[Any]:
+        """
+        Extract candidates from inbox files in worker processes.
+
+        Args:
+            inbox_files: Inbox files to extract, in build order
+            workers: Number of worker processes
+
+        Returns:
+            One entry per file: its (characters, locations) candidates, or
+            the exception raised while extracting it
+        """
+        extracted: List[Any] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_extract_candidates, f) for f in inbox_files]
+            for future in futures:
+                try:
+                    extracted.append(future.result())
+                except Exception as e:
+                    extracted.append(e)
+        return extracted
+
     def _load_storygraph(self) -> Dict:
         """Load or create storygraph.json."""
         storygraph_path = self.build_path / "storygraph.json"
 
         if storygraph_path.exists():
-            return json.loads(storygraph_path.read_text())
+            return _read_json(storygraph_path)
 
         project_id = self.project_path.name
         return {
@@ -151,6 +302,75 @@ class CanonBuilder:
             "evidence_index": {}
         }
 
+    def _inbox_key(self, inbox_file: Path) -> str:
+        """Project-relative POSIX path used as an inbox index key."""
+        return inbox_file.relative_to(self.project_path).as_posix()
+
+    def _changed_inbox_files(
+        self,
+        storygraph: Dict,
+        inbox_digests: Dict[str, str]
+    ) -> List[Path]:
+        """
+        Select inbox files that are new or changed since the last build.
+
+        Every file counts as changed when the extraction version or the
+        disambiguation settings differ from those of the last build.
+
+        Args:
+            storygraph: Loaded storygraph with optional inbox_index
+            inbox_digests: Current content digest per inbox key
+
+        Returns:
+            Inbox files to process
+        """
+        inbox_index = storygraph.get("inbox_index", {})
+        if storygraph.get("inbox_fingerprint") != self._inbox_fingerprint():
+            inbox_index = {}
+        return [
+            self.project_path / key
+            for key, digest in inbox_digests.items()
+            if inbox_index.get(key, {}).get("blake2b") != digest
+        ]
+
+    def _inbox_fingerprint(self) -> str:
+        """Digest of the extraction version and resolution settings."""
+        settings = {
+            "extraction_version": EXTRACTION_VERSION,
+            "fuzzy_threshold": self.fuzzy_threshold,
+            "auto_accept": self.auto_accept_threshold,
+            "always_ask_new": self.always_ask_new,
+        }
+        encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _drop_inbox_scenes(self, storygraph: Dict, inbox_files: List[Path]):
+        """
+        Remove scene entities that came from inbox files about to be rebuilt.
+
+        Their IDs are handed out again, in order, to the scenes detected in
+        the new content, so an edited file keeps its scene IDs instead of
+        gaining duplicates.
+
+        Args:
+            storygraph: Loaded storygraph, updated in place
+            inbox_files: Inbox files that will be processed again
+        """
+        # The inbox is flat, so a file name identifies the source file even
+        # if the project directory has moved since the last build
+        names = {inbox_file.name for inbox_file in inbox_files}
+        kept = []
+        freed = []
+        for entity in storygraph.get("entities", []):
+            source_file = (entity.get("attributes") or {}).get("source_file")
+            if entity.get("type") == "scene" and source_file and Path(source_file).name in names:
+                freed.append(entity["id"])
+            else:
+                kept.append(entity)
+
+        storygraph["entities"] = kept
+        self._free_scene_ids = deque(sorted(freed, key=_scene_number))
+
     def _load_existing_entities(self, storygraph: Dict):
         """Load existing entities into the matcher."""
         for entity in storygraph.get("entities", []):
@@ -161,8 +381,25 @@ class CanonBuilder:
             self.matcher.add_entity(canonical_id, name, aliases)
             self._entities[canonical_id] = entity
 
-    def _process_inbox_file(self, inbox_file: Path) -> Dict:
-        """Process a single inbox file."""
+        self._last_scene_num = max(
+            [_scene_number(e["id"]) for e in self._entities.values() if e.get("type") == "scene"]
+            + [_scene_number(scene_id) for scene_id in self._free_scene_ids],
+            default=0,
+        )
+
+    def _process_inbox_file(
+        self,
+        inbox_file: Path,
+        extracted: Optional[Tuple[List[ExtractionCandidate], List[ExtractionCandidate]]] = None
+    ) -> Dict:
+        """
+        Process a single inbox file.
+
+        Args:
+            inbox_file: Inbox file to process
+            extracted: Character and location candidates already extracted
+                in a worker process, or None to extract them here
+        """
         result = {
             "chars_created": 0,
             "chars_linked": 0,
@@ -171,8 +408,13 @@ class CanonBuilder:
             "scenes_created": 0,
         }
 
-        # Extract characters using instance extractor
-        characters = self.char_extractor.extract_from_file(inbox_file)
+        # Extract characters and locations using instance extractors
+        if extracted is None:
+            extracted = (
+                self.char_extractor.extract_from_file(inbox_file),
+                self.loc_extractor.extract_from_file(inbox_file),
+            )
+        characters, locations = extracted
 
         for candidate in characters:
             canonical_id = self._resolve_or_create_entity(
@@ -184,9 +426,6 @@ class CanonBuilder:
                 else:
                     result["chars_created"] += 1
 
-        # Extract locations using instance extractor
-        locations = self.loc_extractor.extract_from_file(inbox_file)
-
         for candidate in locations:
             canonical_id = self._resolve_or_create_entity(
                 candidate, "location"
@@ -222,18 +461,14 @@ class CanonBuilder:
         """
         normalized = candidate.normalized
 
-        # Try confident match first
-        canonical_id = self.matcher.is_confident_match(
-            normalized,
-            self.auto_accept_threshold
-        )
+        # One matcher pass serves both the confident link and the queue check
+        match = self.matcher.match(normalized)
 
-        if canonical_id:
-            return canonical_id
+        # Try confident match first
+        if match and match.score >= self.auto_accept_threshold * 100:
+            return match.canonical_id
 
         # Try fuzzy match
-        match = self.matcher.match(normalized)
-
         if match and match.score >= 50:
             # Queue for disambiguation
             self._queue_items.append({
@@ -292,7 +527,6 @@ class CanonBuilder:
         prefix = prefix_map.get(entity_type, "ENT")
 
         # Generate ID
-        import hashlib
         slug = candidate.normalized.replace(" ", "_")[:20]
         hash_part = hashlib.md5(candidate.text.encode()).hexdigest()[:8]
         canonical_id = f"{prefix}_{slug}_{hash_part}"
@@ -318,12 +552,16 @@ class CanonBuilder:
 
     def _create_scene_from_boundary(self, boundary: SceneBoundary, source_file: Path):
         """Create a scene entity from a slugline boundary."""
-        # Use a counter for scene numbering since SceneBoundary doesn't track it
-        scene_num = len([e for e in self._entities.values() if e.get("type") == "scene"]) + 1
-        canonical_id = f"SCN_{scene_num:03d}"
-
-        if canonical_id in self._entities:
-            return
+        # Reuse the IDs of scenes dropped for this rebuild before numbering
+        # new ones, since SceneBoundary doesn't track scene numbers
+        if self._free_scene_ids:
+            canonical_id = self._free_scene_ids.popleft()
+            scene_num = _scene_number(canonical_id)
+        else:
+            self._last_scene_num += 1
+            scene_num = self._last_scene_num
+            canonical_id = f"SCN_{scene_num:03d}"
+            self._scenes_created += 1
 
         entity = {
             "id": canonical_id,
@@ -364,7 +602,7 @@ class CanonBuilder:
 
         # Write back
         storygraph_path = self.build_path / "storygraph.json"
-        storygraph_path.write_text(json.dumps(storygraph, indent=2))
+        _write_json(storygraph_path, storygraph)
 
     def _write_vault_notes(self) -> int:
         """
@@ -373,26 +611,12 @@ class CanonBuilder:
         Returns:
             Number of notes written
         """
-        notes_written = 0
-
-        for entity_id, entity in self._entities.items():
-            entity_type = entity.get("type", "")
+        # Don't fail the build if vault writing fails for an entity
+        written = self.vault_writer.write_entities(
+            self._entities.values(), skip_errors=True
+        )
 
-            try:
-                if entity_type == "character":
-                    self.vault_writer.write_character(entity)
-                    notes_written += 1
-                elif entity_type == "location":
-                    self.vault_writer.write_location(entity)
-                    notes_written += 1
-                elif entity_type == "scene":
-                    self.vault_writer.write_scene(entity)
-                    notes_written += 1
-            except Exception:
-                # Don't fail the build if vault writing fails
-                pass
-
-        return notes_written
+        return sum(1 for path in written if path is not None)
 
     def _update_disambiguation_queue(self):
         """Update disambiguation queue file."""
@@ -400,7 +624,7 @@ class CanonBuilder:
 
         existing = {"version": "1.0", "items": []}
         if queue_path.exists():
-            existing = json.loads(queue_path.read_text())
+            existing = _read_json(queue_path)
 
         # Add new items
         existing["items"].extend(self._queue_items)
@@ -412,7 +636,7 @@ class CanonBuilder:
             key=lambda i: i.get("id", "")
         )
 
-        queue_path.write_text(json.dumps(existing, indent=2))
+        _write_json(queue_path, existing)
 
 
 def build_canon(project_path: Path, config: Dict = None) -> CanonBuildResult:
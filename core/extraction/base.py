@@ -4,10 +4,10 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 from pathlib import Path
 
-from .patterns import ExtractionPattern
+from .patterns import BLOCK_REF_PATTERN, ExtractionPattern
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionCandidate:
     """A candidate entity extracted from text."""
     text: str                      # Original matched text
@@ -153,8 +153,7 @@ class BaseExtractor(ABC):
         block_ref = ""
         for i, line in enumerate(lines):
             # Look for block ref at end of line (^ev_xxxx)
-            import re
-            ref_match = re.search(r'\^([a-z0-9_]+)$', line)
+            ref_match = BLOCK_REF_PATTERN.search(line)
             if ref_match:
                 block_ref = ref_match.group(1)
 
@@ -232,6 +232,17 @@ SCENE_PATTERNS = [
 ]
 
 
+# Block reference at end of an inbox line (e.g., ^ev_a1b2)
+BLOCK_REF_PATTERN = re.compile(r'\^([a-z0-9_]+)$')
+
+# Literals at least one of which every slugline/transition pattern needs.
+# One combined pass rules out plain action and dialogue lines before the
+# individual scene patterns are tried.
+SCENE_TRIGGER_PATTERN = re.compile(
+    r'INT|EXT|I/E|CUT TO:|FADE TO:|FADE OUT|DISSOLVE TO:|SMASH CUT:|TIME CUT:|MATCH CUT:',
+    re.IGNORECASE
+)
+
 # Common words to exclude from character extraction
 CHARACTER_EXCLUSIONS = {
     # Common words that might match patterns
@@ -8,14 +8,16 @@ from dataclasses import dataclass
 
 from .base import BaseExtractor, ExtractionCandidate
 from .patterns import (
+    BLOCK_REF_PATTERN,
     SCENE_PATTERNS,
+    SCENE_TRIGGER_PATTERN,
     ExtractionPattern,
     get_time_of_day,
     get_int_ext,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneBoundary:
     """Represents a detected scene boundary."""
     line_number: int
@@ -135,11 +137,14 @@ class SceneExtractor(BaseExtractor):
         # Find block refs
         block_ref = ""
         for i, line in enumerate(lines):
-            import re
-            ref_match = re.search(r'\^([a-z0-9_]+)$', line)
+            ref_match = BLOCK_REF_PATTERN.search(line)
             if ref_match:
                 block_ref = ref_match.group(1)
 
+            # Skip lines that cannot match any scene pattern
+            if not SCENE_TRIGGER_PATTERN.search(line):
+                continue
+
             # Get context
             context_start = max(0, i - 2)
             context_end = min(len(lines), i + 3)
@@ -2,7 +2,8 @@
 
 Per ADR-0003: Use rapidfuzz for fuzzy string matching.
 """
-from typing import Dict, List, Optional, Tuple
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 try:
@@ -24,7 +25,15 @@ except ImportError:
         return (2.0 * common / (len(s1) + len(s2))) * 100
 
 
-@dataclass
+def _char_mask(text: str) -> int:
+    """Bitmask of the characters in text, folded into 64 bits."""
+    mask = 0
+    for c in text:
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
+
+@dataclass(slots=True)
 class AliasMatch:
     """A potential alias match."""
     text: str
@@ -48,6 +57,8 @@ class FuzzyMatcher:
         self._known_entities: Dict[str, str] = {}  # normalized_name -> canonical_id
         self._entity_names: Dict[str, str] = {}    # canonical_id -> canonical_name
         self._known_aliases: Dict[str, str] = {}   # alias -> canonical_id
+        self._choices: Optional[List[str]] = None  # normalized names, for batch scoring
+        self._char_masks: Dict[str, int] = {}      # normalized_name -> character bitmask
 
     def add_entity(self, canonical_id: str, name: str, aliases: List[str] = None):
         """
@@ -58,13 +69,16 @@ class FuzzyMatcher:
             name: The canonical name (e.g., "Fox")
             aliases: Known aliases (e.g., ["FOX", "F.", "the fox"])
         """
-        normalized = self._normalize(name)
+        # Interned so repeated names across entities share one string
+        normalized = sys.intern(self._normalize(name))
         self._known_entities[normalized] = canonical_id
         self._entity_names[canonical_id] = name
+        self._choices = None
+        self._char_masks[normalized] = _char_mask(normalized)
 
         if aliases:
             for alias in aliases:
-                alias_norm = self._normalize(alias)
+                alias_norm = sys.intern(self._normalize(alias))
                 self._known_aliases[alias_norm] = canonical_id
 
     def load_from_confucius(self, aliases: Dict[str, str]):
@@ -74,7 +88,9 @@ class FuzzyMatcher:
         Args:
             aliases: Dict mapping alias -> canonical_id
         """
-        self._known_aliases.update({self._normalize(k): v for k, v in aliases.items()})
+        self._known_aliases.update(
+            {sys.intern(self._normalize(k)): v for k, v in aliases.items()}
+        )
 
     def _normalize(self, text: str) -> str:
         """Normalize text for comparison."""
@@ -87,6 +103,42 @@ class FuzzyMatcher:
         else:
             return simple_ratio(s1, s2)
 
+    def _fuzzy_choices(self) -> List[str]:
+        """Normalized entity names in insertion order, rebuilt after additions."""
+        if self._choices is None:
+            self._choices = list(self._known_entities)
+        return self._choices
+
+    def _prefiltered_names(self, normalized: str) -> Iterator[str]:
+        """
+        Yield known names whose fallback score could reach the threshold.
+
+        simple_ratio counts query characters that occur in the name, so each
+        query mask bit missing from the name's mask is at least one
+        unmatched character. That caps the score at
+        200 * (len(query) - missing) / (len(query) + len(name)), and names
+        whose cap is below the threshold are skipped without scoring.
+        """
+        q_len = len(normalized)
+        q_mask = _char_mask(normalized)
+        for entity_name in self._known_entities:
+            missing = (q_mask & ~self._char_masks[entity_name]).bit_count()
+            if 200 * (q_len - missing) >= self.threshold * (q_len + len(entity_name)):
+                yield entity_name
+
+    def _exact_match(self, text: str, normalized: str) -> Optional[AliasMatch]:
+        """Look up a normalized name among known entities."""
+        canonical_id = self._known_entities.get(normalized)
+        if canonical_id is None:
+            return None
+        return AliasMatch(
+            text=text,
+            canonical_id=canonical_id,
+            canonical_name=self._entity_names[canonical_id],
+            score=100.0,
+            method="exact"
+        )
+
     def match(self, text: str) -> Optional[AliasMatch]:
         """
         Find the best match for a text string.
@@ -105,15 +157,9 @@ class FuzzyMatcher:
         normalized = self._normalize(text)
 
         # 1. Exact match
-        if normalized in self._known_entities:
-            canonical_id = self._known_entities[normalized]
-            return AliasMatch(
-                text=text,
-                canonical_id=canonical_id,
-                canonical_name=self._entity_names[canonical_id],
-                score=100.0,
-                method="exact"
-            )
+        exact = self._exact_match(text, normalized)
+        if exact:
+            return exact
 
         # 2. Known alias
         if normalized in self._known_aliases:
@@ -127,10 +173,32 @@ class FuzzyMatcher:
             )
 
         # 3. Fuzzy match
+        if RAPIDFUZZ_AVAILABLE:
+            # Scores every name in one native call; ties keep the first name
+            best = process.extractOne(
+                normalized,
+                self._fuzzy_choices(),
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=self.threshold,
+            )
+            if best is None or best[1] <= 0:
+                return None
+            entity_name, score, _ = best
+            canonical_id = self._known_entities[entity_name]
+            return AliasMatch(
+                text=text,
+                canonical_id=canonical_id,
+                canonical_name=self._entity_names[canonical_id],
+                score=score,
+                method="fuzzy"
+            )
+
         best_match = None
         best_score = 0
 
-        for entity_name, canonical_id in self._known_entities.items():
+        for entity_name in self._prefiltered_names(normalized):
+            canonical_id = self._known_entities[entity_name]
             score = self._fuzzy_score(normalized, entity_name)
 
             if score > best_score and score >= self.threshold:
@@ -160,13 +228,30 @@ class FuzzyMatcher:
         candidates = []
 
         # Check exact first
-        exact = self.match(text)
-        if exact and exact.method == "exact":
+        exact = self._exact_match(text, normalized)
+        if exact:
             return [exact]
 
         # Find all fuzzy matches
-        for entity_name, canonical_id in self._known_entities.items():
-            score = self._fuzzy_score(normalized, entity_name)
+        if RAPIDFUZZ_AVAILABLE:
+            scored = (
+                (entity_name, score)
+                for entity_name, score, _ in process.extract_iter(
+                    normalized,
+                    self._fuzzy_choices(),
+                    scorer=fuzz.ratio,
+                    processor=None,
+                    score_cutoff=self.threshold,
+                )
+            )
+        else:
+            scored = (
+                (entity_name, self._fuzzy_score(normalized, entity_name))
+                for entity_name in self._prefiltered_names(normalized)
+            )
+
+        for entity_name, score in scored:
+            canonical_id = self._known_entities[entity_name]
 
             if score >= self.threshold:
                 candidates.append(AliasMatch(
@@ -9,6 +9,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Buffer size for streaming file contents into the hash
+HASH_CHUNK_SIZE = 1 << 20
+
 
 @dataclass
 class FileState:
@@ -74,13 +77,18 @@ def calculate_file_hash(file_path: Path) -> str:
         FileNotFoundError: If file does not exist
     """
     file_path = Path(file_path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        f = open(file_path, "rb", buffering=0)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
     sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
+    buf = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buf)
+    with f:
+        # Refill one buffer rather than allocating a bytes object per chunk
+        while n := f.readinto(buf):
+            sha256.update(view[:n])
     return sha256.hexdigest()
 
 
@@ -11,6 +11,7 @@ Protected block format:
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -36,6 +37,24 @@ class ProtectedBlock:
     block_id: Optional[str] = None  # For future multi-block support
 
 
+@lru_cache(maxsize=None)
+def _block_pattern(begin_marker: str, end_marker: str) -> re.Pattern:
+    """
+    Compile (once per marker pair) the pattern matching a protected block.
+
+    Args:
+        begin_marker: Start marker literal
+        end_marker: End marker literal
+
+    Returns:
+        Pattern capturing (begin marker, content, end marker)
+    """
+    return re.compile(
+        rf"({re.escape(begin_marker)})(.*?)({re.escape(end_marker)})",
+        re.DOTALL,
+    )
+
+
 def extract_protected_content(
     text: str,
     begin_marker: str = BEGIN_MARKER,
@@ -54,15 +73,7 @@ def extract_protected_content(
     """
     blocks = []
 
-    # Escape markers for regex
-    begin_escaped = re.escape(begin_marker)
-    end_escaped = re.escape(end_marker)
-
-    # Pattern to match protected block with content
-    pattern = re.compile(
-        rf"({begin_escaped})(.*?)({end_escaped})",
-        re.DOTALL,
-    )
+    pattern = _block_pattern(begin_marker, end_marker)
 
     for match in pattern.finditer(text):
         block = ProtectedBlock(
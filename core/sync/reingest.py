@@ -278,7 +278,7 @@ class VaultReingester:
                 "evidence_index": {},
             }
 
-        return json.loads(self.storygraph_path.read_text())
+        return json.loads(self.storygraph_path.read_text(encoding="utf-8"))
 
     def _save_storygraph(self) -> None:
         """Save StoryGraph to JSON file."""
@@ -12,10 +12,32 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import groupby
+from operator import itemgetter, methodcaller
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import json
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Character cue line followed by a parenthetical: "JOHN\n(quietly)"
+_CHAR_HEADER_RE = re.compile(r"^([A-Z][A-Z\s]+)\n\(", re.MULTILINE)
+
+# Key function for grouping scriptgraph paragraphs by scene
+_paragraph_scene_id = methodcaller("get", "scene_id")
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON build file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
 
 
 class IssueSeverity(Enum):
@@ -32,6 +54,14 @@ class IssueSeverity(Enum):
     INFO = "info"  # Informational only
 
 
+# Sort rank per severity: errors first, then warnings, then info
+_SEVERITY_RANK = {
+    IssueSeverity.ERROR: 0,
+    IssueSeverity.WARNING: 1,
+    IssueSeverity.INFO: 2,
+}
+
+
 class IssueCategory(Enum):
     """Category of validation issue."""
 
@@ -67,6 +97,11 @@ class Issue:
     resolved: bool = False
     resolved_at: Optional[datetime] = None
     resolution_note: Optional[str] = None
+    severity_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the numeric severity rank used for sorting."""
+        self.severity_rank = _SEVERITY_RANK.get(self.severity, 2)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -143,6 +178,10 @@ class BaseValidator(ABC):
         self._issues: List[Issue] = []
         self._storygraph: Optional[Dict[str, Any]] = None
         self._scriptgraph: Optional[Dict[str, Any]] = None
+        self._scene_text: Dict[str, str] = {}
+        self._entities_by_id: Dict[str, Dict[str, Any]] = {}
+        self._entities_by_type: Dict[str, List[Dict[str, Any]]] = {}
+        self._char_name_index: Dict[str, str] = {}
         self._issue_counter = 0
 
     def _load_graphs(self) -> None:
@@ -150,17 +189,69 @@ class BaseValidator(ABC):
         # Load storygraph
         storygraph_path = self.build_path / "storygraph.json"
         if storygraph_path.exists():
-            self._storygraph = json.loads(storygraph_path.read_text())
+            self._storygraph = _read_json(storygraph_path)
         else:
             self._storygraph = {"entities": [], "edges": [], "evidence_index": {}}
+        self._index_entities()
 
         # Load scriptgraph (optional)
         scriptgraph_path = self.build_path / "scriptgraph.json"
         if scriptgraph_path.exists():
-            self._scriptgraph = json.loads(scriptgraph_path.read_text())
+            self._scriptgraph = _read_json(scriptgraph_path)
         else:
             self._scriptgraph = None
 
+        self._scene_text = self._index_scene_text()
+
+    def _index_entities(self) -> None:
+        """
+        Index storygraph entities by ID and by type in one pass.
+
+        Lookups otherwise rescan the entity list on every call. The first
+        entity wins when an ID is repeated, and each type keeps file order.
+        """
+        by_id: Dict[str, Dict[str, Any]] = {}
+        by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for entity in self._storygraph.get("entities", []):
+            by_id.setdefault(entity.get("id"), entity)
+            by_type.setdefault(entity.get("type"), []).append(entity)
+        self._entities_by_id = by_id
+        self._entities_by_type = by_type
+
+    def _index_scene_text(self) -> Dict[str, str]:
+        """
+        Index scriptgraph paragraph text by scene ID.
+
+        Paragraphs are normally stored in scene order, so a single groupby
+        pass builds the index. Falls back to a dict build if a scene's
+        paragraphs turn out not to be contiguous.
+
+        Returns:
+            Dict mapping scene_id -> newline-joined paragraph text
+        """
+        if not self._scriptgraph:
+            return {}
+
+        paragraphs = self._scriptgraph.get("paragraphs", [])
+        index: Dict[str, str] = {}
+
+        for scene_id, group in groupby(paragraphs, key=_paragraph_scene_id):
+            if scene_id in index:
+                # Paragraphs are not in scene order
+                return self._index_scene_text_unordered(paragraphs)
+            index[scene_id] = "\n".join(p.get("text", "") for p in group)
+
+        return index
+
+    def _index_scene_text_unordered(
+        self, paragraphs: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Index paragraph text by scene ID without assuming ordering."""
+        texts: Dict[str, List[str]] = {}
+        for para in paragraphs:
+            texts.setdefault(para.get("scene_id"), []).append(para.get("text", ""))
+        return {scene_id: "\n".join(parts) for scene_id, parts in texts.items()}
+
     def _create_issue_id(self, rule_code: str) -> str:
         """
         Generate a unique issue ID.
@@ -251,6 +342,28 @@ class BaseValidator(ABC):
         """
         pass
 
+    def _sort_issues(self) -> List[Issue]:
+        """
+        Sort issues by severity, then scene number.
+
+        Severity has only three ranks, so issues are bucketed by rank in one
+        pass and each bucket is sorted on scene number alone. Sorting is
+        stable, so equal keys keep their emission order.
+
+        Returns:
+            Sorted list of issues
+        """
+        buckets: Tuple[List[Tuple[int, Issue]], ...] = ([], [], [])
+        for issue in self._issues:
+            buckets[issue.severity_rank].append((issue.scene_number or 9999, issue))
+
+        by_scene = itemgetter(0)
+        result: List[Issue] = []
+        for bucket in buckets:
+            bucket.sort(key=by_scene)
+            result.extend(issue for _, issue in bucket)
+        return result
+
     def get_issues(self) -> List[Issue]:
         """
         Get all issues detected by this validator.
@@ -301,11 +414,7 @@ class BaseValidator(ABC):
         if not self._storygraph:
             self._load_graphs()
 
-        return [
-            e
-            for e in self._storygraph.get("entities", [])
-            if e.get("type") == entity_type
-        ]
+        return list(self._entities_by_type.get(entity_type, ()))
 
     def get_entity_by_id(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -320,10 +429,43 @@ class BaseValidator(ABC):
         if not self._storygraph:
             self._load_graphs()
 
-        for entity in self._storygraph.get("entities", []):
-            if entity.get("id") == entity_id:
-                return entity
-        return None
+        return self._entities_by_id.get(entity_id)
+
+    def _build_character_name_index(self) -> Dict[str, str]:
+        """
+        Map upper-cased character names and aliases to character IDs.
+
+        Earlier characters win when a name or alias is shared.
+
+        Returns:
+            Dict: NAME -> character_id
+        """
+        index: Dict[str, str] = {}
+        for char in self.get_characters():
+            char_id = char.get("id", "")
+            index.setdefault(char.get("name", "").upper(), char_id)
+            for alias in char.get("aliases", []):
+                index.setdefault(alias.upper(), char_id)
+        return index
+
+    def _extract_characters_from_content(self, content: str) -> List[str]:
+        """
+        Extract character IDs from dialogue cues in scene content.
+
+        Cue names are resolved through the index built by
+        _build_character_name_index, which validators store in
+        _char_name_index at the start of validate().
+
+        Returns:
+            Character IDs in order of first cue
+        """
+        index = self._char_name_index
+        seen: Dict[str, None] = {}
+        for match in _CHAR_HEADER_RE.findall(content):
+            char_id = index.get(match.strip())
+            if char_id is not None:
+                seen[char_id] = None
+        return list(seen)
 
     def get_scenes_sorted(self) -> List[Dict[str, Any]]:
         """
@@ -52,6 +52,7 @@ class KnowledgeValidator(BaseValidator):
     def __init__(self, build_path: Path):
         """Initialize knowledge validator."""
         super().__init__(build_path)
+        self._char_names_lower: Dict[str, Optional[str]] = {}
 
     def validate(self) -> List[Issue]:
         """
@@ -62,6 +63,8 @@ class KnowledgeValidator(BaseValidator):
         """
         self._load_graphs()
         self.clear_issues()
+        self._char_name_index = self._build_character_name_index()
+        self._char_names_lower = {}
 
         # Build knowledge states
         knowledge_states = self._build_knowledge_states()
@@ -74,15 +77,7 @@ class KnowledgeValidator(BaseValidator):
         self._check_relationship_continuity(relationship_timeline)
 
         # Sort issues by severity, then scene number
-        return sorted(
-            self._issues,
-            key=lambda i: (
-                0 if i.severity == IssueSeverity.ERROR
-                else 1 if i.severity == IssueSeverity.WARNING
-                else 2,
-                i.scene_number or 9999,
-            ),
-        )
+        return self._sort_issues()
 
     def _build_knowledge_states(self) -> Dict[str, Dict[int, Set[str]]]:
         """
@@ -190,24 +185,8 @@ class KnowledgeValidator(BaseValidator):
         if chars:
             return chars
 
-        # Extract from content
-        pattern = r"^([A-Z][A-Z\s]+)\n\("
-        matches = re.findall(pattern, content, re.MULTILINE)
-
-        char_ids = []
-        characters = self.get_characters()
-
-        for match in matches:
-            name = match.strip()
-            for char in characters:
-                if char.get("name", "").upper() == name:
-                    char_ids.append(char.get("id", ""))
-                    break
-                if any(a.upper() == name for a in char.get("aliases", [])):
-                    char_ids.append(char.get("id", ""))
-                    break
-
-        return list(set(char_ids))
+        # Extract from content, resolving cue names through the name index
+        return self._extract_characters_from_content(content)
 
     def _extract_revealed_information(self, content: str) -> List[Dict]:
         """
@@ -276,21 +255,28 @@ class KnowledgeValidator(BaseValidator):
         # Get context around the match
         start = max(0, match.start() - 100)
         end = min(len(content), match.end() + 100)
-        context = content[start:end]
+        context = content[start:end].lower()
 
         # Get characters present in scene
         scene_chars = self._get_characters_present(scene, content)
 
         # Find mentioned characters in context
         for char_id in scene_chars:
-            char = self.get_entity_by_id(char_id)
-            if char:
-                name = char.get("name", "")
-                if name.lower() in context.lower():
-                    chars.append(char_id)
+            name = self._char_name_lower(char_id)
+            if name is not None and name in context:
+                chars.append(char_id)
 
         return chars
 
+    def _char_name_lower(self, character_id: str) -> Optional[str]:
+        """Get a character's lower-cased name, memoized for the current run."""
+        if character_id not in self._char_names_lower:
+            char = self.get_entity_by_id(character_id)
+            self._char_names_lower[character_id] = (
+                char.get("name", "").lower() if char else None
+            )
+        return self._char_names_lower[character_id]
+
     def _check_unlearned_knowledge(
         self, knowledge_states: Dict[str, Dict[int, Set[str]]]
     ) -> None:
@@ -126,16 +126,10 @@ class ValidationOrchestrator:
 
         Order: severity (error first), then scene_number, then issue_id
         """
-        severity_order = {
-            IssueSeverity.ERROR: 0,
-            IssueSeverity.WARNING: 1,
-            IssueSeverity.INFO: 2,
-        }
-
         return sorted(
             issues,
             key=lambda i: (
-                severity_order.get(i.severity, 99),
+                i.severity_rank,
                 i.scene_number or 9999,
                 i.issue_id,
             ),
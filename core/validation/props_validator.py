@@ -6,12 +6,55 @@ Detects prop continuity issues:
 - PROP-03: Prop damage that doesn't persist
 """
 import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set
 
 from .base import BaseValidator, Issue, IssueSeverity
 
 
+@dataclass(slots=True, frozen=True)
+class PropMention:
+    """A single prop mention found in scene text."""
+
+    prop: str
+    action: str
+    holder: Optional[str] = None
+
+
+@dataclass(slots=True)
+class AppearanceBlock:
+    """Appearances of a single prop, stored as parallel columns in scene order."""
+
+    scene_ids: List[str] = field(default_factory=list)
+    scene_numbers: List[int] = field(default_factory=list)
+    actions: List[str] = field(default_factory=list)
+    holders: List[Optional[str]] = field(default_factory=list)
+    raw_props: List[str] = field(default_factory=list)
+    evidence_ids: List[List[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.scene_ids)
+
+    def append(
+        self,
+        scene_id: str,
+        scene_number: int,
+        action: str,
+        holder: Optional[str],
+        raw_prop: str,
+        evidence_ids: List[str],
+    ) -> None:
+        """Add one appearance to the end of every column."""
+        self.scene_ids.append(scene_id)
+        self.scene_numbers.append(scene_number)
+        self.actions.append(action)
+        self.holders.append(holder)
+        self.raw_props.append(raw_prop)
+        self.evidence_ids.append(evidence_ids)
+
+
 class PropsValidator(BaseValidator):
     """
     Validator for prop continuity.
@@ -46,6 +89,15 @@ class PropsValidator(BaseValidator):
         ],
     }
 
+    # Patterns compiled once at import rather than looked up per call
+    _COMPILED_PATTERNS = {
+        action_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for action_type, patterns in PROP_PATTERNS.items()
+    }
+
+    # Character name immediately before a prop action: "JOHN holds the gun"
+    _HOLDER_PATTERN = re.compile(r"([A-Z][a-z]+)\s+(?:holds?|has|takes?|gives?)\s*$")
+
     # Introduction action types
     INTRODUCTION_ACTIONS = {"holding", "taking", "giving"}
 
@@ -76,24 +128,19 @@ class PropsValidator(BaseValidator):
         self._check_damage_persistence(timeline)
 
         # Sort issues by severity, then scene number
-        return sorted(
-            self._issues,
-            key=lambda i: (
-                0 if i.severity == IssueSeverity.ERROR
-                else 1 if i.severity == IssueSeverity.WARNING
-                else 2,
-                i.scene_number or 9999,
-            ),
-        )
-
-    def _build_prop_timeline(self) -> Dict[str, List[Dict[str, Any]]]:
+        return self._sort_issues()
+
+    def _build_prop_timeline(self) -> Dict[str, AppearanceBlock]:
         """
         Build timeline of prop appearances.
 
+        Scenes are visited in scene-number order, so each prop's appearances
+        are appended already sorted; the checks rely on that ordering.
+
         Returns:
-            Dict: normalized_prop_name -> list of appearance dicts
+            Dict: normalized_prop_name -> AppearanceBlock
         """
-        timeline: Dict[str, List[Dict[str, Any]]] = {}
+        timeline: Dict[str, AppearanceBlock] = {}
 
         # Get all scenes sorted by scene number
         scenes = self.get_scenes_sorted()
@@ -101,62 +148,56 @@ class PropsValidator(BaseValidator):
         for scene in scenes:
             scene_id = scene.get("id", "")
             scene_num = scene.get("attributes", {}).get("scene_number", 0)
+            evidence_ids = scene.get("evidence_ids", [])
             scene_content = self._get_scene_content(scene)
 
             # Extract prop mentions from scene
             prop_mentions = self._extract_prop_mentions(scene_content)
 
             for mention in prop_mentions:
-                prop_name = self._normalize_prop_name(mention["prop"])
-                action = mention["action"]
-                holder = mention.get("holder")
-
-                if prop_name not in timeline:
-                    timeline[prop_name] = []
-
-                timeline[prop_name].append({
-                    "scene_id": scene_id,
-                    "scene_number": scene_num,
-                    "action": action,
-                    "holder": holder,
-                    "raw_prop": mention["prop"],
-                    "evidence_ids": scene.get("evidence_ids", []),
-                })
+                prop_name = self._normalize_prop_name(mention.prop)
+
+                block = timeline.get(prop_name)
+                if block is None:
+                    block = timeline[prop_name] = AppearanceBlock()
+
+                block.append(
+                    scene_id,
+                    scene_num,
+                    mention.action,
+                    mention.holder,
+                    mention.prop,
+                    evidence_ids,
+                )
 
         return timeline
 
     def _get_scene_content(self, scene: Dict) -> str:
         """Get scene content from scriptgraph or scene notes."""
-        if self._scriptgraph:
-            scene_id = scene.get("id", "")
-            for para in self._scriptgraph.get("paragraphs", []):
-                if para.get("scene_id") == scene_id:
-                    return para.get("text", "")
+        scene_id = scene.get("id", "")
+        if scene_id in self._scene_text:
+            return self._scene_text[scene_id]
 
         return scene.get("description", "") or scene.get("notes", "")
 
-    def _extract_prop_mentions(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_prop_mentions(self, content: str) -> List[PropMention]:
         """
         Extract prop mentions from scene content.
 
         Returns:
-            List of dicts with prop, action, and optional holder
+            List of PropMention records with prop, action, and optional holder
         """
         mentions = []
 
-        for action_type, patterns in self.PROP_PATTERNS.items():
+        for action_type, patterns in self._COMPILED_PATTERNS.items():
             for pattern in patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
+                for match in pattern.finditer(content):
                     prop_text = match.group(1).strip()
 
                     # Try to extract holder from context
                     holder = self._extract_holder(content, match)
 
-                    mentions.append({
-                        "prop": prop_text,
-                        "action": action_type,
-                        "holder": holder,
-                    })
+                    mentions.append(PropMention(prop_text, action_type, holder))
 
         return mentions
 
@@ -166,8 +207,7 @@ class PropsValidator(BaseValidator):
         start = max(0, match.start() - 50)
         context = content[start : match.start()]
 
-        # Pattern: "JOHN holds the gun"
-        name_match = re.search(r"([A-Z][a-z]+)\s+(?:holds?|has|takes?|gives?)\s*$", context)
+        name_match = self._HOLDER_PATTERN.search(context)
         if name_match:
             name = name_match.group(1)
             # Try to match to a character entity
@@ -205,63 +245,50 @@ class PropsValidator(BaseValidator):
 
         return normalized
 
-    def _check_prop_introductions(self, timeline: Dict[str, List[Dict]]) -> None:
+    def _check_prop_introductions(self, timeline: Dict[str, AppearanceBlock]) -> None:
         """PROP-01: Check for props appearing without introduction."""
-        for prop_name, appearances in timeline.items():
-            if not appearances:
+        for block in timeline.values():
+            if not block:
                 continue
 
-            # Sort by scene number
-            appearances.sort(key=lambda x: x.get("scene_number", 0))
-
-            # Get first appearance
-            first = appearances[0]
-            first_action = first.get("action", "")
-
-            # Check if first action is an introduction
-            if first_action not in self.INTRODUCTION_ACTIONS:
-                # Check if prop appears earlier with introduction action
-                introduced = False
-                for ap in appearances:
-                    if ap.get("action") in self.INTRODUCTION_ACTIONS:
-                        if ap.get("scene_number", 999) < first.get("scene_number", 0):
-                            introduced = True
-                            break
+            # The first appearance has nothing before it, so its action alone
+            # decides whether the prop was introduced
+            if block.actions[0] not in self.INTRODUCTION_ACTIONS:
+                raw_prop = block.raw_props[0]
+                scene_number = block.scene_numbers[0]
+                self._add_issue(
+                    rule_code="PROP-01",
+                    title="Prop appears without introduction",
+                    description=(
+                        f"Prop '{raw_prop}' appears in "
+                        f"scene {scene_number} without a clear introduction "
+                        f"(holding, receiving, picking up, etc.)"
+                    ),
+                    severity=IssueSeverity.WARNING,
+                    scene_id=block.scene_ids[0],
+                    scene_number=scene_number,
+                    suggested_fix=(
+                        f"Add an introduction beat for '{raw_prop}' "
+                        f"before or in scene {scene_number}"
+                    ),
+                )
 
-                if not introduced:
-                    self._add_issue(
-                        rule_code="PROP-01",
-                        title="Prop appears without introduction",
-                        description=(
-                            f"Prop '{first.get('raw_prop', prop_name)}' appears in "
-                            f"scene {first.get('scene_number')} without a clear introduction "
-                            f"(holding, receiving, picking up, etc.)"
-                        ),
-                        severity=IssueSeverity.WARNING,
-                        scene_id=first.get("scene_id"),
-                        scene_number=first.get("scene_number"),
-                        suggested_fix=(
-                            f"Add an introduction beat for '{first.get('raw_prop', prop_name)}' "
-                            f"before or in scene {first.get('scene_number')}"
-                        ),
-                    )
-
-    def _check_ownership_transfers(self, timeline: Dict[str, List[Dict]]) -> None:
+    def _check_ownership_transfers(self, timeline: Dict[str, AppearanceBlock]) -> None:
         """PROP-02: Check for ownership transfers not shown."""
-        for prop_name, appearances in timeline.items():
-            if len(appearances) < 2:
+        for block in timeline.values():
+            if len(block) < 2:
                 continue
 
-            # Sort by scene number
-            appearances.sort(key=lambda x: x.get("scene_number", 0))
+            # A running count of transfer actions lets each holder change be
+            # checked without rescanning every appearance
+            scene_nums = block.scene_numbers
+            holders = block.holders
+            transfers_before = self._count_transfers(block)
 
             # Track holder changes
-            for i in range(1, len(appearances)):
-                prev = appearances[i - 1]
-                curr = appearances[i]
-
-                prev_holder = prev.get("holder")
-                curr_holder = curr.get("holder")
+            for i in range(1, len(block)):
+                prev_holder = holders[i - 1]
+                curr_holder = holders[i]
 
                 # Skip if no holder info or same holder
                 if not prev_holder or not curr_holder:
@@ -269,8 +296,13 @@ class PropsValidator(BaseValidator):
                 if prev_holder == curr_holder:
                     continue
 
+                prev_scene = scene_nums[i - 1]
+                curr_scene = scene_nums[i]
+
                 # Check if there's a transfer action between them
-                if self._has_transfer_action(appearances, prev, curr):
+                if self._has_transfer_action(
+                    scene_nums, transfers_before, prev_scene, curr_scene
+                ):
                     continue
 
                 # Find character names
@@ -278,45 +310,44 @@ class PropsValidator(BaseValidator):
                 curr_char = self.get_entity_by_id(curr_holder)
                 prev_name = prev_char.get("name", prev_holder) if prev_char else prev_holder
                 curr_name = curr_char.get("name", curr_holder) if curr_char else curr_holder
+                raw_prop = block.raw_props[i]
 
                 self._add_issue(
                     rule_code="PROP-02",
                     title="Ownership transfer not shown",
                     description=(
-                        f"Prop '{curr.get('raw_prop', prop_name)}' changes holder from "
-                        f"{prev_name} to {curr_name} between scenes {prev.get('scene_number')} "
-                        f"and {curr.get('scene_number')} without showing the transfer"
+                        f"Prop '{raw_prop}' changes holder from "
+                        f"{prev_name} to {curr_name} between scenes {prev_scene} "
+                        f"and {curr_scene} without showing the transfer"
                     ),
                     severity=IssueSeverity.ERROR,
-                    scene_id=curr.get("scene_id"),
-                    scene_number=curr.get("scene_number"),
+                    scene_id=block.scene_ids[i],
+                    scene_number=curr_scene,
                     entity_ids=[prev_holder, curr_holder],
-                    evidence_ids=curr.get("evidence_ids", []),
+                    evidence_ids=block.evidence_ids[i],
                     suggested_fix=(
-                        f"Show {prev_name} giving '{curr.get('raw_prop', prop_name)}' to "
+                        f"Show {prev_name} giving '{raw_prop}' to "
                         f"{curr_name}, or explain the transfer"
                     ),
                 )
 
-    def _check_damage_persistence(self, timeline: Dict[str, List[Dict]]) -> None:
+    def _check_damage_persistence(self, timeline: Dict[str, AppearanceBlock]) -> None:
         """PROP-03: Check for damage not persisting."""
-        for prop_name, appearances in timeline.items():
-            if len(appearances) < 2:
+        for block in timeline.values():
+            if len(block) < 2:
                 continue
 
-            # Sort by scene number
-            appearances.sort(key=lambda x: x.get("scene_number", 0))
+            actions = block.actions
+            scene_nums = block.scene_numbers
 
-            # Track damage state
-            damaged_scene = None
+            # Track damage state (index of the damaging appearance)
+            damaged = None
             repaired = False
 
-            for ap in appearances:
-                action = ap.get("action", "")
-
+            for i, action in enumerate(actions):
                 # Track damage
                 if action == "damaging":
-                    damaged_scene = ap
+                    damaged = i
                     repaired = False
                     continue
 
@@ -326,40 +357,54 @@ class PropsValidator(BaseValidator):
                     continue
 
                 # If damaged and appears intact later without repair
-                if damaged_scene and not repaired:
-                    if ap.get("scene_number", 0) > damaged_scene.get("scene_number", 0):
+                if damaged is not None and not repaired:
+                    if scene_nums[i] > scene_nums[damaged]:
                         # Check if holding action suggests intact prop
                         if action in ["holding", "taking"]:
+                            raw_prop = block.raw_props[i]
                             self._add_issue(
                                 rule_code="PROP-03",
                                 title="Damaged prop appears intact",
                                 description=(
-                                    f"Prop '{ap.get('raw_prop', prop_name)}' was damaged in "
-                                    f"scene {damaged_scene.get('scene_number')} but appears "
-                                    f"intact in scene {ap.get('scene_number')} without repair"
+                                    f"Prop '{raw_prop}' was damaged in "
+                                    f"scene {scene_nums[damaged]} but appears "
+                                    f"intact in scene {scene_nums[i]} without repair"
                                 ),
                                 severity=IssueSeverity.WARNING,
-                                scene_id=ap.get("scene_id"),
-                                scene_number=ap.get("scene_number"),
+                                scene_id=block.scene_ids[i],
+                                scene_number=scene_nums[i],
                                 suggested_fix=(
-                                    f"Either show '{ap.get('raw_prop', prop_name)}' being "
+                                    f"Either show '{raw_prop}' being "
                                     f"repaired, or maintain damage state throughout"
                                 ),
                             )
                             # Only report once per damage
                             break
 
-    def _has_transfer_action(
-        self, appearances: List[Dict], prev: Dict, curr: Dict
-    ) -> bool:
-        """Check if there's a transfer action between two appearances."""
-        prev_scene = prev.get("scene_number", 0)
-        curr_scene = curr.get("scene_number", 0)
+    def _count_transfers(self, block: AppearanceBlock) -> List[int]:
+        """
+        Build prefix counts of transfer actions.
 
-        for ap in appearances:
-            ap_scene = ap.get("scene_number", 0)
-            if prev_scene <= ap_scene <= curr_scene:
-                if ap.get("action") in self.TRANSFER_ACTIONS:
-                    return True
+        Returns:
+            List where entry k is the number of transfer actions among the
+            first k appearances
+        """
+        counts = [0]
+        total = 0
+        for action in block.actions:
+            if action in self.TRANSFER_ACTIONS:
+                total += 1
+            counts.append(total)
+        return counts
 
-        return False
+    def _has_transfer_action(
+        self,
+        scene_nums: List[int],
+        transfers_before: List[int],
+        prev_scene: int,
+        curr_scene: int,
+    ) -> bool:
+        """Check if there's a transfer action between two scene numbers."""
+        lo = bisect_left(scene_nums, prev_scene)
+        hi = bisect_right(scene_nums, curr_scene)
+        return transfers_before[hi] > transfers_before[lo]
@@ -3,12 +3,16 @@
 Creates Obsidian-compatible markdown reports in vault/80_Reports/
 with wikilinks to scenes, entities, and evidence.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base import Issue, IssueCategory, IssueSeverity
 
+# Upper bound on concurrent report file writes
+MAX_REPORT_WRITERS = 8
+
 
 class ReportGenerator:
     """
@@ -41,32 +45,50 @@ class ReportGenerator:
             Dict mapping report names to their file paths
         """
         reports = {}
+        payloads: List[Tuple[Path, str]] = []
 
-        # Generate summary report
-        summary_path = self._generate_summary_report(all_issues)
+        # Render summary report
+        summary_path = self.reports_path / "validation-summary.md"
+        payloads.append((summary_path, self._render_summary_report(all_issues)))
         reports["summary"] = summary_path
 
-        # Generate category-specific reports
+        # Render category-specific reports
         for category in IssueCategory:
             category_issues = [i for i in all_issues if i.category == category]
             if category_issues:
-                category_path = self._generate_category_report(category, category_issues)
+                category_path = self.reports_path / f"{category.value}-issues.md"
+                payloads.append(
+                    (category_path, self._render_category_report(category, category_issues))
+                )
                 reports[category.value] = category_path
 
+        # Reports are independent once rendered, so overlap the file writes
+        self._write_reports(payloads)
+
         return reports
 
-    def _generate_summary_report(self, all_issues: List[Issue]) -> Path:
+    def _write_reports(self, payloads: List[Tuple[Path, str]]) -> None:
+        """
+        Write rendered reports to disk in parallel.
+
+        Args:
+            payloads: List of (report_path, content) tuples
+        """
+        max_workers = min(MAX_REPORT_WRITERS, len(payloads))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume results so write errors propagate to the caller
+            list(executor.map(lambda payload: payload[0].write_text(payload[1]), payloads))
+
+    def _render_summary_report(self, all_issues: List[Issue]) -> str:
         """
-        Generate the main validation summary report.
+        Render the main validation summary report.
 
         Args:
             all_issues: List of all detected issues
 
         Returns:
-            Path to the generated report
+            Markdown content of the report
         """
-        report_path = self.reports_path / "validation-summary.md"
-
         # Calculate statistics
         total = len(all_issues)
         severity_counts = self._count_by_severity(all_issues)
@@ -151,25 +173,21 @@ class ReportGenerator:
             if cat_issues:
                 lines.append(f"- [[{category.value}-issues|{category.value.title()} Issues]] ({len(cat_issues)})")
 
-        # Write report
-        report_path.write_text("\n".join(lines))
-        return report_path
+        return "\n".join(lines)
 
-    def _generate_category_report(
+    def _render_category_report(
         self, category: IssueCategory, issues: List[Issue]
-    ) -> Path:
+    ) -> str:
         """
-        Generate a detailed category-specific report.
+        Render a detailed category-specific report.
 
         Args:
             category: The issue category
             issues: List of issues in this category
 
         Returns:
-            Path to the generated report
+            Markdown content of the report
         """
-        report_path = self.reports_path / f"{category.value}-issues.md"
-
         # Build report content
         lines = [
             f"# {category.value.title()} Issues",
@@ -196,9 +214,7 @@ class ReportGenerator:
                 lines.extend(self._format_issue_detailed(issue))
                 lines.append("")
 
-        # Write report
-        report_path.write_text("\n".join(lines))
-        return report_path
+        return "\n".join(lines)
 
     def _format_issue_brief(self, issue: Issue) -> str:
         """
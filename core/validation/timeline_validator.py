@@ -6,12 +6,59 @@ Detects timeline inconsistencies:
 - TIME-04: Characters in two places at once
 """
 import re
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .base import BaseValidator, Issue, IssueSeverity
 
 
+# Upper bound on memoized location names held during a run
+LOCATION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _normalize_location(name: str) -> str:
+    """Normalize a location name for distance lookups."""
+    return name.lower().strip()
+
+
+def _compile_marker_search(markers: List[str]) -> re.Pattern:
+    """
+    Compile time markers into a single alternation.
+
+    Longer markers are tried first, so a search returns the leftmost marker
+    in the text and, at that position, the longest one ("MOMENTS LATER"
+    rather than "LATER").
+
+    Args:
+        markers: Marker literals
+
+    Returns:
+        Compiled marker pattern
+    """
+    alternation = "|".join(
+        re.escape(m) for m in sorted(markers, key=len, reverse=True)
+    )
+    return re.compile(alternation)
+
+
+def _minimal_markers(markers: List[str]) -> Tuple[str, ...]:
+    """
+    Reduce markers to those that contain no other marker.
+
+    Any text holding some marker also holds one of these, which makes them
+    a cheap substring prefilter ahead of the full marker search.
+    """
+    return tuple(
+        marker
+        for marker in markers
+        if not any(other != marker and other in marker for other in markers)
+    )
+
+
 class TimelineValidator(BaseValidator):
     """
     Validator for timeline continuity.
@@ -44,6 +91,23 @@ class TimelineValidator(BaseValidator):
         "MEANWHILE",
     ]
 
+    # Set views for O(1) membership checks
+    _TIME_SKIP_SET = frozenset(TIME_SKIP_MARKERS)
+    _CONTINUOUS_SET = frozenset(CONTINUOUS_MARKERS)
+
+    # All markers, searched in one pass
+    _TIME_MARKERS = TIME_SKIP_MARKERS + CONTINUOUS_MARKERS
+    _TIME_MARKER_RE = _compile_marker_search(_TIME_MARKERS)
+    _TIME_MARKER_LEADS = _minimal_markers(_TIME_MARKERS)
+
+    # Basic time anchors that resolve a nearby relative phrase. Only the
+    # irreducible ones are searched: every other anchor contains one of them,
+    # so their (non-overlapping) occurrences come out ordered by start and end
+    _ANCHOR_RE = re.compile(
+        "|".join(re.escape(m) for m in _minimal_markers(TIME_SKIP_MARKERS[:4])),
+        re.IGNORECASE,
+    )
+
     # Relative time phrases that need resolution
     RELATIVE_TIME_PHRASES = [
         r"later\s+that\s+(day|night|morning|evening|afternoon)",
@@ -55,6 +119,9 @@ class TimelineValidator(BaseValidator):
         r"shortly\s+(?:after|before)",
     ]
 
+    # Relative time patterns compiled once at import
+    _RELATIVE_TIME_RES = [re.compile(p, re.IGNORECASE) for p in RELATIVE_TIME_PHRASES]
+
     # Default travel time estimates (in minutes) - can be overridden
     DEFAULT_TRAVEL_TIMES: Dict[Tuple[str, str], int] = {}
 
@@ -72,6 +139,11 @@ class TimelineValidator(BaseValidator):
         """
         super().__init__(build_path)
         self.location_distances = location_distances or self.DEFAULT_TRAVEL_TIMES
+        self._location_index: Dict[str, str] = {}
+        self._distances: Dict[Tuple[str, str], int] = {}
+        self._known_locations: Set[str] = set()
+        self._travel_times: Dict[Tuple[str, str], Optional[int]] = {}
+        self._char_name_cache: Dict[str, str] = {}
 
     def validate(self) -> List[Issue]:
         """
@@ -82,80 +154,63 @@ class TimelineValidator(BaseValidator):
         """
         self._load_graphs()
         self.clear_issues()
+        self._char_name_index = self._build_character_name_index()
+        self._location_index = self._build_location_index()
+        self._distances = {
+            (_normalize_location(a), _normalize_location(b)): minutes
+            for (a, b), minutes in self.location_distances.items()
+        }
+        self._known_locations = {loc for pair in self._distances for loc in pair}
+        self._travel_times = {}
+        self._char_name_cache = {}
 
         # Build timelines
-        scene_timeline = self._build_scene_timeline()
-        char_timeline = self._build_character_timeline()
+        scene_timeline, char_timeline = self._build_timelines()
 
         # Run checks
         self._check_impossible_travel(char_timeline, scene_timeline)
         self._check_unresolved_time_phrases(scene_timeline)
         self._check_character_location_conflicts(char_timeline, scene_timeline)
 
-        # Sort issues by severity, then scene number
-        return sorted(
-            self._issues,
-            key=lambda i: (
-                0 if i.severity == IssueSeverity.ERROR
-                else 1 if i.severity == IssueSeverity.WARNING
-                else 2,
-                i.scene_number or 9999,
-            ),
-        )
-
-    def _build_scene_timeline(self) -> List[Dict[str, Any]]:
+        return self._sort_issues()
+
+    def _build_timelines(
+        self,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
         """
-        Build ordered scene timeline.
+        Build the scene timeline and character timeline in one pass.
+
+        Scene content, time marker and location ID are derived once per
+        scene and shared by both timelines.
 
         Returns:
-            List of scene dicts sorted by scene_number
+            Tuple of (scene dicts sorted by scene_number,
+            character_id -> list of appearance dicts)
         """
-        timeline = []
-        scenes = self.get_scenes_sorted()
+        scene_timeline: List[Dict[str, Any]] = []
+        char_timeline: Dict[str, List[Dict[str, Any]]] = {}
 
-        for scene in scenes:
+        for scene in self.get_scenes_sorted():
             scene_id = scene.get("id", "")
             attrs = scene.get("attributes", {})
+            scene_num = attrs.get("scene_number", 0)
+            location = attrs.get("location", "")
+            location_id = self._find_location_id(location)
+            evidence_ids = scene.get("evidence_ids", [])
             scene_content = self._get_scene_content(scene)
+            time_marker = self._extract_time_marker(scene_content)
 
-            # Extract metadata
-            scene_entry = {
+            scene_timeline.append({
                 "scene_id": scene_id,
-                "scene_number": attrs.get("scene_number", 0),
-                "location": attrs.get("location", ""),
-                "location_id": self._find_location_id(attrs.get("location", "")),
+                "scene_number": scene_num,
+                "location": location,
+                "location_id": location_id,
                 "time_of_day": attrs.get("time_of_day", ""),
                 "int_ext": attrs.get("int_ext", ""),
-                "time_marker": self._extract_time_marker(scene_content),
-                "evidence_ids": scene.get("evidence_ids", []),
+                "time_marker": time_marker,
+                "evidence_ids": evidence_ids,
                 "content": scene_content,
-            }
-
-            timeline.append(scene_entry)
-
-        return timeline
-
-    def _build_character_timeline(self) -> Dict[str, List[Dict[str, Any]]]:
-        """
-        Build timeline of character appearances.
-
-        Returns:
-            Dict: character_id -> list of appearance dicts
-        """
-        timeline: Dict[str, List[Dict[str, Any]]] = {}
-
-        # Get all characters
-        characters = self.get_characters()
-
-        # Get all scenes
-        scenes = self.get_scenes_sorted()
-
-        for scene in scenes:
-            scene_id = scene.get("id", "")
-            attrs = scene.get("attributes", {})
-            scene_num = attrs.get("scene_number", 0)
-            location = attrs.get("location", "")
-            scene_content = self._get_scene_content(scene)
+            })
 
             # Get characters in scene
             scene_chars = scene.get("characters", [])
@@ -163,73 +218,73 @@ class TimelineValidator(BaseValidator):
                 scene_chars = self._extract_characters_from_content(scene_content)
 
             for char_id in scene_chars:
-                if char_id not in timeline:
-                    timeline[char_id] = []
+                if char_id not in char_timeline:
+                    char_timeline[char_id] = []
 
-                timeline[char_id].append({
+                char_timeline[char_id].append({
                     "scene_id": scene_id,
                     "scene_number": scene_num,
                     "location": location,
-                    "location_id": self._find_location_id(location),
-                    "time_marker": self._extract_time_marker(scene_content),
-                    "evidence_ids": scene.get("evidence_ids", []),
+                    "location_id": location_id,
+                    "time_marker": time_marker,
+                    "evidence_ids": evidence_ids,
                 })
 
-        return timeline
+        return scene_timeline, char_timeline
 
     def _get_scene_content(self, scene: Dict) -> str:
         """Get scene content from scriptgraph or scene notes."""
-        if self._scriptgraph:
-            scene_id = scene.get("id", "")
-            for para in self._scriptgraph.get("paragraphs", []):
-                if para.get("scene_id") == scene_id:
-                    return para.get("text", "")
+        scene_id = scene.get("id", "")
+        if scene_id in self._scene_text:
+            return self._scene_text[scene_id]
 
         return scene.get("description", "") or scene.get("notes", "")
 
+    def _build_location_index(self) -> Dict[str, str]:
+        """
+        Map lower-cased location names and aliases to location IDs.
+
+        Earlier locations win when a name or alias is shared.
+
+        Returns:
+            Dict: name -> location_id
+        """
+        index: Dict[str, str] = {}
+        for loc in self.get_locations():
+            loc_id = loc.get("id")
+            index.setdefault(loc.get("name", "").lower(), loc_id)
+            for alias in loc.get("aliases", []):
+                index.setdefault(alias.lower(), loc_id)
+        return index
+
     def _find_location_id(self, location_name: str) -> Optional[str]:
         """Find location entity ID by name."""
         if not location_name:
             return None
 
-        locations = self.get_locations()
-        for loc in locations:
-            if loc.get("name", "").lower() == location_name.lower():
-                return loc.get("id")
-            if any(a.lower() == location_name.lower() for a in loc.get("aliases", [])):
-                return loc.get("id")
-
-        return None
-
-    def _extract_characters_from_content(self, content: str) -> List[str]:
-        """Extract character IDs from scene content."""
-        pattern = r"^([A-Z][A-Z\s]+)\n\("
-        matches = re.findall(pattern, content, re.MULTILINE)
+        return self._location_index.get(location_name.lower())
 
-        char_ids = []
-        characters = self.get_characters()
-
-        for match in matches:
-            name = match.strip()
-            for char in characters:
-                if char.get("name", "").upper() == name:
-                    char_ids.append(char.get("id", ""))
-                    break
-                if any(a.upper() == name for a in char.get("aliases", [])):
-                    char_ids.append(char.get("id", ""))
-                    break
-
-        return list(set(char_ids))
+    def _char_display_name(self, char_id: str) -> str:
+        """Get a character's display name, falling back to its ID."""
+        name = self._char_name_cache.get(char_id)
+        if name is None:
+            character = self.get_entity_by_id(char_id)
+            name = character.get("name", char_id) if character else char_id
+            self._char_name_cache[char_id] = name
+        return name
 
     def _extract_time_marker(self, content: str) -> Optional[str]:
-        """Extract time marker from scene content."""
+        """Extract the first time marker appearing in scene content."""
         content_upper = content.upper()
 
-        for marker in self.TIME_SKIP_MARKERS + self.CONTINUOUS_MARKERS:
-            if marker in content_upper:
-                return marker
+        # Most scenes carry no marker; plain substring tests rule that out
+        # faster than running the marker pattern over every position
+        if not any(lead in content_upper for lead in self._TIME_MARKER_LEADS):
+            return None
 
-        return None
+        # The marker that appears first in the text wins
+        match = self._TIME_MARKER_RE.search(content_upper)
+        return match.group(0) if match else None
 
     def _check_impossible_travel(
         self,
@@ -241,8 +296,8 @@ class TimelineValidator(BaseValidator):
             if len(appearances) < 2:
                 continue
 
-            # Sort by scene number
-            appearances.sort(key=lambda x: x.get("scene_number", 0))
+            # Appearances are appended in scene-number order by
+            # _build_timelines, so no re-sort is needed here
 
             for i in range(1, len(appearances)):
                 prev = appearances[i - 1]
@@ -257,7 +312,7 @@ class TimelineValidator(BaseValidator):
 
                 # Check for time skip that explains travel
                 curr_marker = curr.get("time_marker")
-                if curr_marker in self.TIME_SKIP_MARKERS:
+                if curr_marker in self._TIME_SKIP_SET:
                     continue
 
                 # Check travel time
@@ -266,8 +321,7 @@ class TimelineValidator(BaseValidator):
                 # If we have distance data and travel seems impossible
                 if travel_time is not None and travel_time > 30:
                     # No time marker and locations are far apart
-                    character = self.get_entity_by_id(char_id)
-                    char_name = character.get("name", char_id) if character else char_id
+                    char_name = self._char_display_name(char_id)
 
                     self._add_issue(
                         rule_code="TIME-01",
@@ -294,8 +348,15 @@ class TimelineValidator(BaseValidator):
         for scene in scene_timeline:
             content = scene.get("content", "")
 
-            for pattern in self.RELATIVE_TIME_PHRASES:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+            # One forward pass records where every anchor starts and ends
+            anchor_starts: List[int] = []
+            anchor_ends: List[int] = []
+            for anchor in self._ANCHOR_RE.finditer(content):
+                anchor_starts.append(anchor.start())
+                anchor_ends.append(anchor.end())
+
+            for pattern in self._RELATIVE_TIME_RES:
+                matches = pattern.finditer(content)
 
                 for match in matches:
                     phrase = match.group(0)
@@ -304,13 +365,11 @@ class TimelineValidator(BaseValidator):
                     # For simplicity, flag if the phrase exists without explicit time
                     # A more sophisticated check would trace back to find the anchor
                     context_start = max(0, match.start() - 200)
-                    context = content[context_start : match.start()]
 
-                    # Check for time anchors in context
-                    has_anchor = any(
-                        marker.lower() in context.lower()
-                        for marker in self.TIME_SKIP_MARKERS[:4]  # Basic anchors
-                    )
+                    # The last anchor ending before the phrase must also start
+                    # inside the 200-character context window
+                    last = bisect_right(anchor_ends, match.start()) - 1
+                    has_anchor = last >= 0 and anchor_starts[last] >= context_start
 
                     if not has_anchor:
                         self._add_issue(
@@ -338,20 +397,25 @@ class TimelineValidator(BaseValidator):
         """TIME-04: Check for characters in two places at once."""
         # Find simultaneous scenes (CONTINUOUS or SAME_TIME)
         simultaneous_groups = self._find_simultaneous_scenes(scene_timeline)
+        if not simultaneous_groups:
+            return
+
+        appearances_by_scene = self._index_appearances_by_scene(char_timeline)
+        char_order = {char_id: i for i, char_id in enumerate(char_timeline)}
 
-        for group in simultaneous_groups:
+        for group, scene_locations in simultaneous_groups:
             if len(group) < 2:
                 continue
 
-            # Check if any character appears in multiple scenes in this group
-            scene_locations = {s.get("scene_id"): s.get("location") for s in group}
+            # Gather the appearances of each character present in this group
+            group_appearances: Dict[str, List[Dict]] = defaultdict(list)
+            for scene_id in scene_locations:
+                for char_id, ap in appearances_by_scene.get(scene_id, ()):
+                    group_appearances[char_id].append(ap)
 
-            for char_id, appearances in char_timeline.items():
-                char_scenes_in_group = [
-                    ap
-                    for ap in appearances
-                    if ap.get("scene_id") in scene_locations
-                ]
+            # Check if any character appears in multiple scenes in this group
+            for char_id in sorted(group_appearances, key=char_order.__getitem__):
+                char_scenes_in_group = group_appearances[char_id]
 
                 if len(char_scenes_in_group) < 2:
                     continue
@@ -361,8 +425,7 @@ class TimelineValidator(BaseValidator):
 
                 if len(locations) > 1:
                     # Different locations!
-                    character = self.get_entity_by_id(char_id)
-                    char_name = character.get("name", char_id) if character else char_id
+                    char_name = self._char_display_name(char_id)
 
                     loc_list = list(locations)
                     first_ap = char_scenes_in_group[0]
@@ -388,26 +451,54 @@ class TimelineValidator(BaseValidator):
                         ),
                     )
 
+    def _index_appearances_by_scene(
+        self, char_timeline: Dict[str, List[Dict]]
+    ) -> Dict[str, List[Tuple[str, Dict]]]:
+        """
+        Invert the character timeline into per-scene appearance lists.
+
+        Returns:
+            Dict: scene_id -> list of (character_id, appearance dict)
+        """
+        index: Dict[str, List[Tuple[str, Dict]]] = {}
+        for char_id, appearances in char_timeline.items():
+            for ap in appearances:
+                index.setdefault(ap.get("scene_id"), []).append((char_id, ap))
+        return index
+
     def _get_travel_time(self, location_a: str, location_b: str) -> Optional[int]:
         """
         Get travel time between two locations.
 
+        Results are cached per location pair for the current validation run.
+
         Returns:
             Travel time in minutes, or None if unknown
         """
+        key = (location_a, location_b)
+        if key not in self._travel_times:
+            self._travel_times[key] = self._lookup_travel_time(location_a, location_b)
+        return self._travel_times[key]
+
+    def _lookup_travel_time(self, location_a: str, location_b: str) -> Optional[int]:
+        """Look up or estimate travel time between two locations."""
         # Normalize location names for lookup
-        loc_a = location_a.lower().strip()
-        loc_b = location_b.lower().strip()
+        loc_a = _normalize_location(location_a)
+        loc_b = _normalize_location(location_b)
 
         # Check direct lookup
         key = (loc_a, loc_b)
-        if key in self.location_distances:
-            return self.location_distances[key]
+        if key in self._distances:
+            return self._distances[key]
 
         # Check reverse
         key_rev = (loc_b, loc_a)
-        if key_rev in self.location_distances:
-            return self.location_distances[key_rev]
+        if key_rev in self._distances:
+            return self._distances[key_rev]
+
+        # Without distance data for either side there is nothing to estimate from
+        if loc_a not in self._known_locations and loc_b not in self._known_locations:
+            return None
 
         # Estimate based on heuristics
         # Same building = 1-5 minutes
@@ -431,36 +522,34 @@ class TimelineValidator(BaseValidator):
 
     def _find_simultaneous_scenes(
         self, scene_timeline: List[Dict]
-    ) -> List[List[Dict]]:
+    ) -> List[Tuple[List[Dict], Dict[str, str]]]:
         """
         Find groups of scenes that occur at the same time.
 
         Returns:
-            List of scene groups that are simultaneous
+            List of (simultaneous scene group, scene_id -> location) pairs
         """
-        groups: List[List[Dict]] = []
-        current_group: List[Dict] = []
+        groups: List[Tuple[List[Dict], Dict[str, str]]] = []
+        continuous = self._CONTINUOUS_SET
+        n = len(scene_timeline)
+        i = 1
+
+        while i < n:
+            if scene_timeline[i].get("time_marker") not in continuous:
+                i += 1
+                continue
 
-        for scene in scene_timeline:
-            marker = scene.get("time_marker")
-
-            if marker in self.CONTINUOUS_MARKERS:
-                # This scene is simultaneous with previous
-                if current_group:
-                    current_group.append(scene)
-                else:
-                    # Start new group with previous scene if available
-                    pass
-            else:
-                # Save previous group
-                if len(current_group) > 1:
-                    groups.append(current_group)
-                # Start new group
-                current_group = [scene]
-
-        # Don't forget last group
-        if len(current_group) > 1:
-            groups.append(current_group)
+            # A run of continuous scenes is simultaneous with the scene
+            # right before it, even when that scene is itself continuous
+            anchor = scene_timeline[i - 1]
+            group = [anchor]
+            scene_locations = {anchor.get("scene_id"): anchor.get("location")}
+            while i < n and scene_timeline[i].get("time_marker") in continuous:
+                scene = scene_timeline[i]
+                group.append(scene)
+                scene_locations.setdefault(scene.get("scene_id"), scene.get("location"))
+                i += 1
+            groups.append((group, scene_locations))
 
         return groups
 
@@ -472,7 +561,7 @@ class TimelineValidator(BaseValidator):
         marker_b = scene_b.get("time_marker")
 
         # If one has CONTINUOUS/SAME_TIME marker, they're simultaneous
-        if marker_a in self.CONTINUOUS_MARKERS or marker_b in self.CONTINUOUS_MARKERS:
+        if marker_a in self._CONTINUOUS_SET or marker_b in self._CONTINUOUS_SET:
             return True
 
         return False
@@ -6,11 +6,43 @@ Detects wardrobe inconsistencies across scenes:
 - WARD-03: Missing signature items
 """
 import re
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .base import BaseValidator, Issue, IssueSeverity
 
+# Upper bound on memoized wardrobe scans held during a run
+WARDROBE_SCAN_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=WARDROBE_SCAN_CACHE_SIZE)
+def _scan_wardrobe_mentions(
+    patterns: Tuple[re.Pattern, ...], content: str
+) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Find every wardrobe mention in content, memoized per (patterns, text).
+
+    Scenes falling back to shared description text, or identical action
+    lines, are only scanned once per run.
+
+    Returns:
+        Tuple of (lower-cased wardrobe description, context window start,
+        context window end), in pattern order
+    """
+    mentions = []
+    for pattern in patterns:
+        for match in pattern.finditer(content):
+            wardrobe_desc = match.group(1).strip()
+
+            # Character names near the mention decide who it belongs to
+            start = max(0, match.start() - 100)
+            end = min(len(content), match.end() + 50)
+            mentions.append((wardrobe_desc.lower(), start, end))
+
+    return tuple(mentions)
+
 
 class WardrobeValidator(BaseValidator):
     """
@@ -32,6 +64,11 @@ class WardrobeValidator(BaseValidator):
         r"(?:removes?|takes off)\s+(?:her|his|the)\s+(.+?)(?:\.|,|\n)",
     ]
 
+    # Wardrobe patterns compiled once at import
+    _COMPILED_WARDROBE_PATTERNS = tuple(
+        re.compile(p, re.IGNORECASE) for p in WARDROBE_PATTERNS
+    )
+
     # Time skip markers that explain wardrobe changes
     TIME_SKIP_MARKERS = [
         "LATER",
@@ -54,6 +91,29 @@ class WardrobeValidator(BaseValidator):
         "AT THE SAME TIME",
     ]
 
+    # Set views for O(1) membership checks
+    _TIME_SKIP_SET = frozenset(TIME_SKIP_MARKERS)
+    _CONTINUOUS_SET = frozenset(CONTINUOUS_MARKERS)
+
+    # All markers as one whole-word alternation, longest first so the
+    # leftmost match is also the longest marker starting there
+    _TIME_MARKER_RE = re.compile(
+        r"\b("
+        + "|".join(
+            re.escape(m)
+            for m in sorted(TIME_SKIP_MARKERS + CONTINUOUS_MARKERS, key=len, reverse=True)
+        )
+        + r")\b"
+    )
+
+    # Time markers are only looked for near the start of a scene
+    TIME_MARKER_SCAN_CHARS = 200
+    _TIME_MARKER_SCAN_END = (
+        TIME_MARKER_SCAN_CHARS
+        + max(map(len, TIME_SKIP_MARKERS + CONTINUOUS_MARKERS))
+        + 1
+    )
+
     def __init__(
         self,
         build_path: Path,
@@ -68,6 +128,7 @@ class WardrobeValidator(BaseValidator):
         """
         super().__init__(build_path)
         self.signature_items = signature_items or {}
+        self._char_entities: Dict[str, Optional[Dict[str, Any]]] = {}
 
     def validate(self) -> List[Issue]:
         """
@@ -78,33 +139,29 @@ class WardrobeValidator(BaseValidator):
         """
         self._load_graphs()
         self.clear_issues()
+        self._char_entities = {}
+        self._char_name_index = self._build_character_name_index()
 
         # Build wardrobe timeline
         timeline = self._build_wardrobe_timeline()
 
+        # Scene text is not needed past this point; release the cached scans
+        _scan_wardrobe_mentions.cache_clear()
+
         # Run checks
         for character_id, appearances in timeline.items():
+            # Appearances are appended while walking scenes in scene order,
+            # so each list is already sorted by scene number
             if len(appearances) < 2:
                 continue
 
-            # Sort by scene number
-            appearances.sort(key=lambda x: x.get("scene_number", 0))
-
             # Check for issues
             self._check_state_changes(character_id, appearances)
             self._check_timeline_conflicts(character_id, appearances)
             self._check_signature_items(character_id, appearances)
 
         # Sort issues by severity, then scene number
-        return sorted(
-            self._issues,
-            key=lambda i: (
-                0 if i.severity == IssueSeverity.ERROR
-                else 1 if i.severity == IssueSeverity.WARNING
-                else 2,
-                i.scene_number or 9999,
-            ),
-        )
+        return self._sort_issues()
 
     def _build_wardrobe_timeline(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -115,8 +172,8 @@ class WardrobeValidator(BaseValidator):
         """
         timeline: Dict[str, List[Dict[str, Any]]] = {}
 
-        # Get all characters
-        characters = self.get_characters()
+        # Lower-cased names per character, resolved once for all scenes
+        char_names: Dict[str, Optional[List[str]]] = {}
 
         # Get all scenes sorted by scene number
         scenes = self.get_scenes_sorted()
@@ -130,11 +187,31 @@ class WardrobeValidator(BaseValidator):
             scene_characters = scene.get("characters", [])
             if not scene_characters:
                 scene_characters = self._extract_characters_from_content(scene_content)
+            if not scene_characters:
+                continue
+
+            # Scan the scene text once and share the hits between characters
+            mentions = self._find_wardrobe_mentions(scene_content)
+            if not mentions:
+                continue
+            content_lower = scene_content.lower()
+            time_marker = None
+            marker_found = False
 
             # Extract wardrobe mentions for each character
             for char_id in scene_characters:
-                wardrobe = self._extract_wardrobe_state(scene_content, char_id)
+                if char_id not in char_names:
+                    char_names[char_id] = self._character_names_lower(char_id)
+                names = char_names[char_id]
+                if names is None:
+                    continue
+
+                hits = self._find_name_hits(content_lower, names)
+                wardrobe = self._match_wardrobe_state(mentions, hits)
                 if wardrobe:
+                    if not marker_found:
+                        time_marker = self._extract_time_marker(scene_content)
+                        marker_found = True
                     if char_id not in timeline:
                         timeline[char_id] = []
                     timeline[char_id].append({
@@ -142,90 +219,122 @@ class WardrobeValidator(BaseValidator):
                         "scene_number": scene_num,
                         "wardrobe_state": wardrobe,
                         "evidence_ids": scene.get("evidence_ids", []),
-                        "time_marker": self._extract_time_marker(scene_content),
+                        "time_marker": time_marker,
                     })
 
         return timeline
 
     def _get_scene_content(self, scene: Dict) -> str:
         """Get scene content from scriptgraph or scene notes."""
-        if self._scriptgraph:
-            # Try to find matching scene in scriptgraph
-            scene_id = scene.get("id", "")
-            for para in self._scriptgraph.get("paragraphs", []):
-                if para.get("scene_id") == scene_id:
-                    return para.get("text", "")
+        scene_id = scene.get("id", "")
+        if scene_id in self._scene_text:
+            return self._scene_text[scene_id]
 
         # Fallback to scene description/notes
         return scene.get("description", "") or scene.get("notes", "")
 
-    def _extract_characters_from_content(self, content: str) -> List[str]:
-        """Extract character IDs from scene content."""
-        # Simple extraction - look for character names in dialogue headers
-        # Pattern: JOHN\n(dialogue)
-        pattern = r"^([A-Z][A-Z\s]+)\n\("
-        matches = re.findall(pattern, content, re.MULTILINE)
-
-        # Map to character entities
-        char_ids = []
-        characters = self.get_characters()
-        for match in matches:
-            name = match.strip()
-            for char in characters:
-                if char.get("name", "").upper() == name:
-                    char_ids.append(char.get("id", ""))
-                    break
-                # Check aliases
-                aliases = char.get("aliases", [])
-                if any(a.upper() == name for a in aliases):
-                    char_ids.append(char.get("id", ""))
-                    break
-
-        return list(set(char_ids))
-
-    def _extract_wardrobe_state(
-        self, content: str, character_id: str
-    ) -> Optional[str]:
+    def _character(self, character_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a character entity, memoized for the current run."""
+        if character_id not in self._char_entities:
+            self._char_entities[character_id] = self.get_entity_by_id(character_id)
+        return self._char_entities[character_id]
+
+    def _char_display_name(self, character_id: str) -> str:
+        """Get a character's display name, falling back to its ID."""
+        character = self._character(character_id)
+        return character.get("name", character_id) if character else character_id
+
+    def _character_names_lower(self, character_id: str) -> Optional[List[str]]:
         """
-        Extract wardrobe state for a character from scene content.
+        Get a character's distinct lower-cased name and aliases.
 
         Returns:
-            Wardrobe description or None
+            List of names, or None if the character is unknown
         """
-        # Get character name for context
-        character = self.get_entity_by_id(character_id)
+        character = self._character(character_id)
         if not character:
             return None
 
-        char_name = character.get("name", "")
-        aliases = character.get("aliases", [])
-        all_names = [char_name] + aliases
+        all_names = [character.get("name", "")] + character.get("aliases", [])
+        return list(dict.fromkeys(name.lower() for name in all_names))
+
+    def _find_wardrobe_mentions(
+        self, content: str
+    ) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Find every wardrobe mention in scene content.
+
+        Returns:
+            Tuple of (lower-cased wardrobe description, context window start,
+            context window end), in pattern order
+        """
+        return _scan_wardrobe_mentions(self._COMPILED_WARDROBE_PATTERNS, content)
+
+    def _find_name_hits(
+        self, content_lower: str, names: List[str]
+    ) -> List[Tuple[int, List[int]]]:
+        """
+        Locate every occurrence of a character's names in scene content.
+
+        Args:
+            content_lower: Lower-cased scene content
+            names: Lower-cased character name and aliases
+
+        Returns:
+            List of (name length, sorted start offsets) for names that occur
+        """
+        hits = []
+        for name in names:
+            offsets = []
+            pos = content_lower.find(name)
+            while pos != -1:
+                offsets.append(pos)
+                pos = content_lower.find(name, pos + 1)
+            if offsets:
+                hits.append((len(name), offsets))
+
+        return hits
+
+    def _match_wardrobe_state(
+        self,
+        mentions: Tuple[Tuple[str, int, int], ...],
+        hits: List[Tuple[int, List[int]]],
+    ) -> Optional[str]:
+        """
+        Pick the first wardrobe mention whose context names the character.
 
-        # Search for wardrobe mentions near character name
-        for pattern in self.WARDROBE_PATTERNS:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                wardrobe_desc = match.group(1).strip()
+        Args:
+            mentions: Output of _find_wardrobe_mentions for the scene
+            hits: Output of _find_name_hits for the character
 
-                # Check if this wardrobe mention is for our character
-                # Look for character name in surrounding context
-                start = max(0, match.start() - 100)
-                end = min(len(content), match.end() + 50)
-                context = content[start:end]
+        Returns:
+            Wardrobe description or None
+        """
+        if not hits:
+            return None
 
-                for name in all_names:
-                    if name.lower() in context.lower():
-                        return wardrobe_desc.lower()
+        for wardrobe_desc, start, end in mentions:
+            for length, offsets in hits:
+                # Earliest occurrence at or after the window start
+                i = bisect_left(offsets, start)
+                if i < len(offsets) and offsets[i] + length <= end:
+                    return wardrobe_desc
 
         return None
 
     def _extract_time_marker(self, content: str) -> Optional[str]:
-        """Extract time marker from scene content."""
-        content_upper = content.upper()
-
-        for marker in self.TIME_SKIP_MARKERS + self.CONTINUOUS_MARKERS:
-            if marker in content_upper:
-                return marker
+        """
+        Extract the first time marker at the head of scene content.
 
+        Time markers belong to the slugline or the opening lines, so only
+        markers starting within the first TIME_MARKER_SCAN_CHARS characters
+        are considered. The scanned slice runs one marker length past that
+        so a marker straddling the limit is still matched whole.
+        """
+        head = content[:self._TIME_MARKER_SCAN_END].upper()
+        match = self._TIME_MARKER_RE.search(head)
+        if match and match.start() < self.TIME_MARKER_SCAN_CHARS:
+            return match.group(1)
         return None
 
     def _check_state_changes(
@@ -248,8 +357,7 @@ class WardrobeValidator(BaseValidator):
                 continue
 
             # Create issue - wardrobe changed without explanation
-            character = self.get_entity_by_id(character_id)
-            char_name = character.get("name", character_id) if character else character_id
+            char_name = self._char_display_name(character_id)
 
             self._add_issue(
                 rule_code="WARD-01",
@@ -293,8 +401,7 @@ class WardrobeValidator(BaseValidator):
                 continue
 
             # ERROR: Wardrobe differs in continuous time
-            character = self.get_entity_by_id(character_id)
-            char_name = character.get("name", character_id) if character else character_id
+            char_name = self._char_display_name(character_id)
 
             self._add_issue(
                 rule_code="WARD-02",
@@ -326,17 +433,18 @@ class WardrobeValidator(BaseValidator):
         if not signature:
             return
 
-        character = self.get_entity_by_id(character_id)
-        char_name = character.get("name", character_id) if character else character_id
+        char_name = self._char_display_name(character_id)
+        signature_lower = [item.lower() for item in signature]
 
         for appearance in appearances:
+            # Wardrobe states are stored lower-cased by _find_wardrobe_mentions
             wardrobe = appearance.get("wardrobe_state", "")
             if not wardrobe:
                 continue
 
             # Check for signature items
-            for item in signature:
-                if item.lower() not in wardrobe.lower():
+            for item, item_lower in zip(signature, signature_lower):
+                if item_lower not in wardrobe:
                     self._add_issue(
                         rule_code="WARD-03",
                         title="Missing signature item",
@@ -362,7 +470,7 @@ class WardrobeValidator(BaseValidator):
         curr_marker = curr_appearance.get("time_marker")
 
         # Time skip markers explain costume changes
-        if curr_marker in self.TIME_SKIP_MARKERS:
+        if curr_marker in self._TIME_SKIP_SET:
             return True
 
         return False
@@ -373,7 +481,7 @@ class WardrobeValidator(BaseValidator):
         """Check if two appearances are in continuous time."""
         curr_marker = curr_appearance.get("time_marker")
 
-        if curr_marker in self.CONTINUOUS_MARKERS:
+        if curr_marker in self._CONTINUOUS_SET:
             return True
 
         # Check if scenes are adjacent numbers
@@ -4,23 +4,89 @@ Writes entity notes to vault directories with evidence links.
 Uses protected block replacement to preserve manual edits.
 """
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Set
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .templates import (
     render_character_template,
     render_location_template,
     render_scene_template,
     _slugify,
+    _today,
 )
 from ..sync.protected_blocks import (
+    BEGIN_MARKER,
+    END_MARKER,
     replace_protected_content,
     has_protected_block,
     ensure_markers,
-    get_protected_content,
 )
 
 
+# Upper bound on threads used for batch note writes
+MAX_NOTE_WRITERS = 8
+
+# Shared stand-in for evidence IDs missing from the index (never mutated)
+_NO_EVIDENCE: Dict[str, Any] = {}
+
+
+@lru_cache(maxsize=8)
+def _read_evidence_index(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse an evidence index file, shared across writers.
+
+    The modification time and size are part of the cache key, so a
+    rewritten index is parsed again. Callers must not mutate the result.
+
+    Args:
+        path: Path to evidence_index.json
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed evidence index
+    """
+    data = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_note(path: Path, content: str) -> None:
+    """
+    Write note text as UTF-8 straight to a file descriptor.
+
+    Skips the buffered text layer used by Path.write_text. Files are created
+    with the same umask-derived permissions as open().
+
+    Args:
+        path: Target file path
+        content: Note content
+    """
+    view = memoryview(content.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(path, flags, 0o666)
+    except FileNotFoundError:
+        # Note directory removed after the writer recorded it as created
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, flags, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class VaultNoteWriter:
     """Writes entity notes to the Obsidian vault.
 
@@ -28,6 +94,9 @@ class VaultNoteWriter:
     <!-- CONFUCIUS:BEGIN AUTO --> ... <!-- CONFUCIUS:END AUTO --> markers.
     """
 
+    # Vault roots whose subdirectories have already been created
+    _dirs_ready: ClassVar[Set[Path]] = set()
+
     def __init__(self, vault_path: Path, build_path: Path = None):
         """
         Initialize the vault note writer.
@@ -39,30 +108,58 @@ class VaultNoteWriter:
         self.vault_path = Path(vault_path)
         self.build_path = Path(build_path) if build_path else self.vault_path.parent / "build"
         self._evidence_index = None
+        self._evidence_links: Dict[str, str] = {}
+
+        # Frontmatter date for notes created by this writer
+        self.created_at = _today()
+
+        # Note directories, joined once rather than per note
+        self.characters_dir = self.vault_path / "10_Characters"
+        self.locations_dir = self.vault_path / "20_Locations"
+        self.scenes_dir = self.vault_path / "50_Scenes"
 
         # Ensure directories exist
         self._ensure_directories()
 
     def _ensure_directories(self):
         """Create vault subdirectories if they don't exist."""
-        dirs = [
-            self.vault_path / "10_Characters",
-            self.vault_path / "20_Locations",
-            self.vault_path / "50_Scenes",
-        ]
-        for d in dirs:
+        if self.vault_path in VaultNoteWriter._dirs_ready:
+            return
+
+        for d in (self.characters_dir, self.locations_dir, self.scenes_dir):
             d.mkdir(parents=True, exist_ok=True)
 
+        VaultNoteWriter._dirs_ready.add(self.vault_path)
+
     def _load_evidence_index(self) -> dict:
         """Load the evidence index for link resolution."""
         if self._evidence_index is None:
             path = self.build_path / "evidence_index.json"
-            if path.exists():
-                self._evidence_index = json.loads(path.read_text())
-            else:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
                 self._evidence_index = {"evidence": {}}
+            else:
+                self._evidence_index = _read_evidence_index(
+                    str(path), stat.st_mtime_ns, stat.st_size
+                )
+            self._evidence_links = {}
         return self._evidence_index
 
+    def _evidence_link(self, ev_id: str) -> str:
+        """
+        Format one evidence list item, memoized per evidence ID.
+
+        Scenes, characters and locations cite many of the same evidence
+        blocks, so each link line is resolved against the index once.
+        """
+        link = self._evidence_links.get(ev_id)
+        if link is None:
+            ev_data = self._evidence_index.get("evidence", {}).get(ev_id, _NO_EVIDENCE)
+            link = f"- [[{ev_data.get('source_path', 'unknown')}#^{ev_id}]]"
+            self._evidence_links[ev_id] = link
+        return link
+
     def format_evidence_links(self, evidence_ids: List[str]) -> str:
         """
         Convert evidence IDs to Obsidian wikilinks.
@@ -76,16 +173,8 @@ class VaultNoteWriter:
         if not evidence_ids:
             return ""
 
-        index = self._load_evidence_index()
-        links = []
-
-        for ev_id in evidence_ids:
-            ev_data = index.get("evidence", {}).get(ev_id, {})
-            source = ev_data.get("source_path", "unknown")
-            link = f"[[{source}#^{ev_id}]]"
-            links.append(link)
-
-        return "\n".join(f"- {link}" for link in links)
+        self._load_evidence_index()
+        return "\n".join(map(self._evidence_link, evidence_ids))
 
     def _write_with_protection(
         self,
@@ -96,8 +185,9 @@ class VaultNoteWriter:
         """
         Write file using protected block replacement.
 
-        If file exists, preserves content outside protected blocks.
-        If file doesn't exist, creates from template.
+        If file exists, preserves content outside protected blocks and
+        skips the write when nothing changed. If file doesn't exist,
+        creates from template.
 
         Args:
             file_path: Target file path
@@ -107,25 +197,31 @@ class VaultNoteWriter:
         Returns:
             Path to written file
         """
-        if file_path.exists():
-            # Read existing content
-            existing = file_path.read_text(encoding="utf-8")
+        try:
+            # Read existing content (no separate exists() stat)
+            original = file_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            original = None
+
+        if original is not None:
+            existing = original
 
             # Ensure markers exist
             if not has_protected_block(existing):
                 existing = ensure_markers(existing)
 
-            # Replace only protected content
+            # Replace only protected content, leaving unchanged notes untouched
             updated = replace_protected_content(existing, new_protected_content)
-            file_path.write_text(updated, encoding="utf-8")
+            if updated != original:
+                _write_note(file_path, updated)
         else:
             # New file - use template
             if full_template_content:
-                file_path.write_text(full_template_content, encoding="utf-8")
+                _write_note(file_path, full_template_content)
             else:
                 # Fallback: create with markers
                 content = f"\n{new_protected_content}\n"
-                file_path.write_text(ensure_markers(content), encoding="utf-8")
+                _write_note(file_path, ensure_markers(content))
 
         return file_path
 
@@ -138,8 +234,38 @@ class VaultNoteWriter:
 
         Returns content between markers (without markers).
         """
-        protected = get_protected_content(template_content)
-        return protected if protected else ""
+        # Templates carry exactly the standard markers, so a plain slice
+        # between them gives the same result as the block regex
+        start = template_content.find(BEGIN_MARKER)
+        if start == -1:
+            return ""
+        start += len(BEGIN_MARKER)
+
+        end = template_content.find(END_MARKER, start)
+        if end == -1:
+            return ""
+
+        return template_content[start:end]
+
+    def _note_path(self, entity: Dict[str, Any]) -> Optional[Path]:
+        """
+        Get the vault note path for an entity.
+
+        Returns:
+            Target file path, or None if the entity type has no note
+        """
+        entity_type = entity.get("type", "")
+
+        if entity_type == "character":
+            slug = _slugify(entity.get("name", "unknown"))
+            return self.characters_dir / f"{slug}.md"
+        elif entity_type == "location":
+            slug = _slugify(entity.get("name", "unknown"))
+            return self.locations_dir / f"{slug}.md"
+        elif entity_type == "scene":
+            return self.scenes_dir / f"{entity.get('id', 'SCN_000')}.md"
+
+        return None
 
     def write_character(self, entity: Dict[str, Any]) -> Path:
         """
@@ -155,14 +281,14 @@ class VaultNoteWriter:
         """
         name = entity.get("name", "unknown")
         slug = _slugify(name)
-        file_path = self.vault_path / "10_Characters" / f"{slug}.md"
+        file_path = self.characters_dir / f"{slug}.md"
 
         # Format evidence links
         evidence_ids = entity.get("evidence_ids", [])
         evidence_links = self.format_evidence_links(evidence_ids)
 
         # Render full template (for new files)
-        full_template = render_character_template(entity, evidence_links)
+        full_template = render_character_template(entity, evidence_links, self.created_at)
 
         # Extract protected content for replacement
         protected_content = self._extract_protected_from_template(full_template)
@@ -184,14 +310,14 @@ class VaultNoteWriter:
         """
         name = entity.get("name", "unknown")
         slug = _slugify(name)
-        file_path = self.vault_path / "20_Locations" / f"{slug}.md"
+        file_path = self.locations_dir / f"{slug}.md"
 
         # Format evidence links
         evidence_ids = entity.get("evidence_ids", [])
         evidence_links = self.format_evidence_links(evidence_ids)
 
         # Render full template (for new files)
-        full_template = render_location_template(entity, evidence_links)
+        full_template = render_location_template(entity, evidence_links, self.created_at)
 
         # Extract protected content for replacement
         protected_content = self._extract_protected_from_template(full_template)
@@ -212,14 +338,14 @@ class VaultNoteWriter:
             Path to the written file
         """
         scene_id = entity.get("id", "SCN_000")
-        file_path = self.vault_path / "50_Scenes" / f"{scene_id}.md"
+        file_path = self.scenes_dir / f"{scene_id}.md"
 
         # Format evidence links
         evidence_ids = entity.get("evidence_ids", [])
         evidence_links = self.format_evidence_links(evidence_ids)
 
         # Render full template (for new files)
-        full_template = render_scene_template(entity, evidence_links)
+        full_template = render_scene_template(entity, evidence_links, self.created_at)
 
         # Extract protected content for replacement
         protected_content = self._extract_protected_from_template(full_template)
@@ -248,8 +374,64 @@ class VaultNoteWriter:
 
         return None
 
+    def write_entities(
+        self,
+        entities: Iterable[Dict[str, Any]],
+        max_workers: int = MAX_NOTE_WRITERS,
+        skip_errors: bool = False,
+    ) -> List[Optional[Path]]:
+        """
+        Write many entity notes concurrently.
 
-def write_entity_note(entity: Dict[str, Any], vault_path: Path, build_path: Path = None) -> Optional[Path]:
+        Entities that map to the same note file are written in input order
+        by a single worker, so the result matches writing them one by one.
+
+        Args:
+            entities: Entity dicts with 'type' field
+            max_workers: Maximum number of writer threads
+            skip_errors: If True, an entity that fails to write yields None
+                instead of aborting the batch
+
+        Returns:
+            Written paths in input order (None for unknown types)
+        """
+        entities = list(entities)
+        results: List[Optional[Path]] = [None] * len(entities)
+
+        groups: Dict[Path, List[int]] = {}
+        for i, entity in enumerate(entities):
+            try:
+                path = self._note_path(entity)
+            except Exception:
+                if not skip_errors:
+                    raise
+                continue
+            if path is not None:
+                groups.setdefault(path, []).append(i)
+
+        if not groups:
+            return results
+
+        def write_group(indices: List[int]) -> None:
+            for i in indices:
+                try:
+                    results[i] = self.write_entity(entities[i])
+                except Exception:
+                    if not skip_errors:
+                        raise
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+            list(executor.map(write_group, groups.values()))
+
+        return results
+
+
+def write_entity_note(
+    entity: Dict[str, Any],
+    vault_path: Path,
+    build_path: Path = None,
+    writer: Optional[VaultNoteWriter] = None,
+) -> Optional[Path]:
     """
     Convenience function to write an entity note.
 
@@ -257,9 +439,11 @@ def write_entity_note(entity: Dict[str, Any], vault_path: Path, build_path: Path
         entity: Entity dict
         vault_path: Path to vault root
         build_path: Optional path to build directory
+        writer: Optional existing writer to reuse across calls
 
     Returns:
         Path to written file
     """
-    writer = VaultNoteWriter(vault_path, build_path)
+    if writer is None:
+        writer = VaultNoteWriter(vault_path, build_path)
     return writer.write_entity(entity)
@@ -5,31 +5,71 @@ Templates generate Obsidian-compatible markdown with:
 - Protected block markers for auto-generated content
 - Evidence links in wikilink format
 """
+import json
+import re
 from datetime import datetime
-from string import Template
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
+# Characters dropped from slugs: anything not alphanumeric or a hyphen
+# (\w is exactly str.isalnum() plus the underscore)
+_SLUG_STRIP_RE = re.compile(r"[^\w-]|_")
 
+# Same rule for ASCII-only slugs, as a str.translate deletion table
+_SLUG_ASCII_STRIP = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isalnum() or c == "-"))
+)
+
+# Strings that stay strings when written as plain (unquoted) YAML scalars
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z_](?:[\w .'()/-]*[\w.')])?")
+
+# Plain words YAML 1.1 loaders read as booleans or null
+_YAML_RESERVED = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+
+# Upper bound on memoized slugs (names repeat across notes and links)
+SLUG_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=SLUG_CACHE_SIZE)
 def _slugify(name: str) -> str:
     """Convert name to URL-safe slug."""
     slug = name.lower().strip()
     slug = slug.replace(" ", "-")
     # Remove non-alphanumeric except hyphens
-    slug = "".join(c for c in slug if c.isalnum() or c == "-")
-    return slug
+    if slug.isascii():
+        # Plain names (letters, digits, hyphens) are already a slug
+        if slug.replace("-", "").isalnum():
+            return slug
+        return slug.translate(_SLUG_ASCII_STRIP)
+    return _SLUG_STRIP_RE.sub("", slug)
+
+
+def _yaml_quote(value: Any) -> str:
+    """Quote a list item as a YAML double-quoted (JSON-compatible) scalar."""
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Format a frontmatter scalar, quoting strings YAML would misread."""
+    if isinstance(value, str) and value and (
+        not _YAML_PLAIN_RE.fullmatch(value) or value.lower() in _YAML_RESERVED
+    ):
+        return _yaml_quote(value)
+    return str(value)
 
 
 def format_yaml_value(value: Any) -> str:
     """Format a value for YAML frontmatter."""
     if isinstance(value, str):
         # Simple string - quote if needed
-        if any(c in value for c in [":", "#", "{", "}", "[", "]", '"', "'"]):
-            return f'"{value}"'
-        return value
+        return _yaml_scalar(value)
     elif isinstance(value, list):
         if not value:
             return "[]"
-        return f"[{', '.join(repr(v) for v in value)}]"
+        return f"[{', '.join(map(_yaml_quote, value))}]"
     elif isinstance(value, bool):
         return "true" if value else "false"
     elif value is None:
@@ -37,17 +77,38 @@ def format_yaml_value(value: Any) -> str:
     return str(value)
 
 
-def render_character_template(entity: Dict[str, Any], evidence_links: str) -> str:
-    """Render a character note from entity data."""
-    now = datetime.now().strftime("%Y-%m-%d")
+def _today() -> str:
+    """Get today's date as used in note frontmatter."""
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _wikilink_list(items: List[str]) -> str:
+    """Format items as a markdown list of wikilinks, or a placeholder."""
+    if not items:
+        return "*None documented*"
+    return "\n".join([f"- [[{item}]]" for item in items])
+
+
+def render_character_template(
+    entity: Dict[str, Any],
+    evidence_links: str,
+    created_at: Optional[str] = None,
+) -> str:
+    """
+    Render a character note from entity data.
+
+    created_at defaults to today's date; batch writers pass one shared
+    value instead of formatting the date per note.
+    """
+    now = created_at or _today()
     aliases = entity.get("aliases", [])
-    aliases_str = ", ".join(repr(a) for a in aliases) if aliases else "[]"
+    aliases_list = "\n".join([f"- {a}" for a in aliases]) if aliases else "*None recorded*"
 
     return f"""---
-id: {entity.get('id', 'unknown')}
-name: {entity.get('name', 'Unknown')}
+id: {_yaml_scalar(entity.get('id', 'unknown'))}
+name: {_yaml_scalar(entity.get('name', 'Unknown'))}
 type: character
-aliases: [{aliases_str}]
+aliases: {format_yaml_value(aliases)}
 created_at: {now}
 ---
 
@@ -56,7 +117,7 @@ created_at: {now}
 <!-- CONFUCIUS:BEGIN AUTO -->
 ## Aliases
 
-{chr(10).join(f'- {a}' for a in aliases) if aliases else '*None recorded*'}
+{aliases_list}
 
 ## First Appearance
 
@@ -73,9 +134,18 @@ created_at: {now}
 """
 
 
-def render_location_template(entity: Dict[str, Any], evidence_links: str) -> str:
-    """Render a location note from entity data."""
-    now = datetime.now().strftime("%Y-%m-%d")
+def render_location_template(
+    entity: Dict[str, Any],
+    evidence_links: str,
+    created_at: Optional[str] = None,
+) -> str:
+    """
+    Render a location note from entity data.
+
+    created_at defaults to today's date; batch writers pass one shared
+    value instead of formatting the date per note.
+    """
+    now = created_at or _today()
     attrs = entity.get("attributes", {})
     int_ext = attrs.get("int_ext", "INT")
     time_of_day = attrs.get("time_of_day", "")
@@ -84,20 +154,21 @@ def render_location_template(entity: Dict[str, Any], evidence_links: str) -> str
     characters = attrs.get("characters", [])
     connected_locations = attrs.get("connected_locations", [])
     scenes = attrs.get("scenes", [])
+    aliases = entity.get("aliases", [])
 
     # Format lists
-    props_str = chr(10).join(f"- [[{p}]]" for p in props) if props else "*None documented*"
-    chars_str = chr(10).join(f"- [[{c}]]" for c in characters) if characters else "*None documented*"
-    connected_str = chr(10).join(f"- [[{loc}]]" for loc in connected_locations) if connected_locations else "*None documented*"
-    scenes_str = chr(10).join(f"- [[{s}]]" for s in scenes) if scenes else "*None documented*"
+    props_str = _wikilink_list(props)
+    chars_str = _wikilink_list(characters)
+    connected_str = _wikilink_list(connected_locations)
+    scenes_str = _wikilink_list(scenes)
 
     return f"""---
-id: {entity.get('id', 'unknown')}
-name: {entity.get('name', 'Unknown Location')}
+id: {_yaml_scalar(entity.get('id', 'unknown'))}
+name: {_yaml_scalar(entity.get('name', 'Unknown Location'))}
 type: location
-int_ext: {int_ext}
-time_of_day: {time_of_day}
-aliases: [{", ".join(repr(a) for a in entity.get("aliases", []))}]
+int_ext: {_yaml_scalar(int_ext)}
+time_of_day: {_yaml_scalar(time_of_day)}
+aliases: {format_yaml_value(aliases)}
 created_at: {now}
 ---
 
@@ -143,9 +214,18 @@ created_at: {now}
 """
 
 
-def render_scene_template(entity: Dict[str, Any], evidence_links: str) -> str:
-    """Render a scene note from entity data."""
-    now = datetime.now().strftime("%Y-%m-%d")
+def render_scene_template(
+    entity: Dict[str, Any],
+    evidence_links: str,
+    created_at: Optional[str] = None,
+) -> str:
+    """
+    Render a scene note from entity data.
+
+    created_at defaults to today's date; batch writers pass one shared
+    value instead of formatting the date per note.
+    """
+    now = created_at or _today()
     attrs = entity.get("attributes", {})
     scene_number = entity.get("id", "SCN_000").replace("SCN_", "")
     location = attrs.get("location", "Unknown Location")
@@ -154,11 +234,11 @@ def render_scene_template(entity: Dict[str, Any], evidence_links: str) -> str:
     slugline = entity.get("name", f"Scene {scene_number}")
 
     return f"""---
-id: {entity.get('id', 'SCN_000')}
+id: {_yaml_scalar(entity.get('id', 'SCN_000'))}
 scene_number: {scene_number}
-location: {location}
-int_ext: {int_ext}
-time_of_day: {time_of_day}
+location: {_yaml_scalar(location)}
+int_ext: {_yaml_scalar(int_ext)}
+time_of_day: {_yaml_scalar(time_of_day)}
 created_at: {now}
 ---
 
@@ -2,45 +2,109 @@
 
 Tests the full flow: inbox → extraction → resolution → storygraph
 """
+import copy
 import json
-import tempfile
 import shutil
-from pathlib import Path
 import pytest
+import yaml
 
+import core.canon as canon
 from core.canon import CanonBuilder, CanonBuildResult, build_canon
 from core.extraction import CharacterExtractor, LocationExtractor, SceneExtractor
 from core.resolution import FuzzyMatcher, create_matcher
 
 
-@pytest.fixture
-def temp_project():
-    """Create a temporary project structure for testing."""
-    temp_dir = Path(tempfile.mkdtemp())
+# Minimal project config, written to gsd.yaml by temp_project
+TEST_CONFIG = {
+    "project": {"id": "test-project", "name": "Test Project"},
+    "disambiguation": {
+        "auto_accept": 0.95,
+        "auto_reject": 0.30,
+        "always_ask_new": False,
+        "fuzzy_threshold": 70
+    }
+}
+
+# Screenplays for the full-pipeline tests, encoded once at import
+SCRIPT_COFFEE = b"""# Test Script
+
+INT. COFFEE SHOP - DAY
+
+JOHN sits at a table. MARY enters.
+
+JOHN
+(happy)
+Hey, Mary! Over here!
+
+MARY
+(smiling)
+Hey, John! Nice to see you.
+
+MARY walks to John's table and sits down.
+
+EXT. PARK - LATER
+
+John and Mary walk together through the park.
+
+CUT TO:
+
+INT. COFFEE SHOP - NIGHT
+
+The coffee shop is now empty.
+"""
+
+SCRIPT_E2E = b"""# Test Screenplay
+
+INT. COFFEE SHOP - DAY
+
+JOHN sits at a corner table, reading a newspaper. ^ev_001
+
+MARY enters, looking around nervously. ^ev_002
+
+JOHN
+(waving)
+Over here, Mary!
+
+MARY walks to John's table and sits down. ^ev_003
+
+EXT. PARK - LATER
+
+John and Mary walk together through the park. ^ev_004
+
+JOHN
+It's a beautiful day.
+
+MARY
+I'm glad we finally met.
+
+EXT. CITY STREET - NIGHT
+
+JOHN walks alone down the empty street. ^ev_005
+"""
+
+
+def project_config() -> dict:
+    """Get a private copy of the project config (tests may mutate it)."""
+    return copy.deepcopy(TEST_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def project_skeleton(tmp_path_factory):
+    """Build the empty project layout once per test session."""
+    skeleton = tmp_path_factory.mktemp("skeleton")
 
     # Create project structure
-    (temp_dir / "inbox").mkdir()
-    (temp_dir / "vault" / "10_Characters").mkdir(parents=True)
-    (temp_dir / "vault" / "20_Locations").mkdir(parents=True)
-    (temp_dir / "vault" / "50_Scenes").mkdir(parents=True)
-    (temp_dir / "build").mkdir()
+    (skeleton / "inbox").mkdir()
+    (skeleton / "vault" / "10_Characters").mkdir(parents=True)
+    (skeleton / "vault" / "20_Locations").mkdir(parents=True)
+    (skeleton / "vault" / "50_Scenes").mkdir(parents=True)
+    (skeleton / "build").mkdir()
 
     # Create minimal config
-    config = {
-        "project": {"id": "test-project", "name": "Test Project"},
-        "disambiguation": {
-            "auto_accept": 0.95,
-            "auto_reject": 0.30,
-            "always_ask_new": False,
-            "fuzzy_threshold": 70
-        }
-    }
-
-    import yaml
-    (temp_dir / "gsd.yaml").write_text(yaml.dump(config))
+    (skeleton / "gsd.yaml").write_text(yaml.safe_dump(TEST_CONFIG))
 
     # Initialize build files
-    (temp_dir / "build" / "storygraph.json").write_text(json.dumps({
+    (skeleton / "build" / "storygraph.json").write_text(json.dumps({
         "version": "1.0",
         "project_id": "test-project",
         "entities": [],
@@ -48,52 +112,87 @@ def temp_project():
         "evidence_index": {}
     }))
 
-    (temp_dir / "build" / "disambiguation_queue.json").write_text(json.dumps({
+    (skeleton / "build" / "disambiguation_queue.json").write_text(json.dumps({
         "version": "1.0",
         "items": []
     }))
 
-    yield temp_dir
+    return skeleton
 
-    # Cleanup
-    shutil.rmtree(temp_dir)
 
+@pytest.fixture
+def temp_project(project_skeleton, tmp_path):
+    """Create a temporary project structure for testing."""
+    project = tmp_path / "project"
+    shutil.copytree(project_skeleton, project)
+    return project
 
-class TestCanonBuilderIntegration:
-    """Integration tests for CanonBuilder."""
 
-    def test_full_pipeline_with_simple_content(self, temp_project):
-        """Test the full canon build pipeline with simple screenplay content."""
-        # Create inbox file
-        inbox_file = temp_project / "inbox" / "test_script.md"
-        inbox_file.write_text("""# Test Script
+@pytest.fixture
+def worker_extraction(monkeypatch):
+    """Send any inbox to worker processes, even on a one-CPU host.
 
-INT. COFFEE SHOP - DAY
+    Returns the worker counts of each pool started, so tests can check that
+    extraction really left the process.
+    """
+    monkeypatch.setattr(canon, "PARALLEL_EXTRACTION_MIN_BYTES", 0)
+    monkeypatch.setattr(canon.os, "cpu_count", lambda: 2)
 
-JOHN sits at a table. MARY enters.
+    pools = []
+    extract_in_workers = CanonBuilder._extract_in_workers
 
-JOHN
-(happy)
-Hey, Mary! Over here!
+    def record(builder, inbox_files, workers):
+        pools.append(workers)
+        return extract_in_workers(builder, inbox_files, workers)
 
-MARY
-(smiling)
-Hey, John! Nice to see you.
+    monkeypatch.setattr(CanonBuilder, "_extract_in_workers", record)
+    return pools
 
-MARY walks to John's table and sits down.
 
-EXT. PARK - LATER
+@pytest.fixture(scope="module")
+def extractors():
+    """Extractors shared across the module, so patterns are compiled once."""
+    return {
+        "character": CharacterExtractor(),
+        "location": LocationExtractor(),
+        "scene": SceneExtractor(),
+    }
 
-John and Mary walk together through the park.
 
-CUT TO:
+@pytest.fixture
+def character_extractor(extractors):
+    """Shared character extractor with per-run state cleared."""
+    extractor = extractors["character"]
+    extractor.reset()
+    return extractor
 
-INT. COFFEE SHOP - NIGHT
 
-The coffee shop is now empty.
-""")
+@pytest.fixture
+def location_extractor(extractors):
+    """Shared location extractor with per-run state cleared."""
+    extractor = extractors["location"]
+    extractor.reset()
+    return extractor
+
+
+@pytest.fixture
+def scene_extractor(extractors):
+    """Shared scene extractor with per-run state cleared."""
+    extractor = extractors["scene"]
+    extractor.reset()
+    return extractor
+
+
+class TestCanonBuilderIntegration:
+    """Integration tests for CanonBuilder."""
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+    def test_full_pipeline_with_simple_content(self, temp_project):
+        """Test the full canon build pipeline with simple screenplay content."""
+        # Create inbox file
+        inbox_file = temp_project / "inbox" / "test_script.md"
+        inbox_file.write_bytes(SCRIPT_COFFEE)
+
+        config = project_config()
         builder = CanonBuilder(temp_project, config)
         result = builder.build()
 
@@ -122,7 +221,7 @@ INT. OFFICE - LATER
 SARAH receives a phone call.
 """)
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         builder = CanonBuilder(temp_project, config)
         result = builder.build()
 
@@ -147,7 +246,7 @@ Elizabeth! Over here!
 LIZ looks around confused.
 """)
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         config["disambiguation"]["always_ask_new"] = True  # Queue ambiguous
 
         builder = CanonBuilder(temp_project, config)
@@ -177,7 +276,7 @@ I/E. ROOFTOP - NIGHT
 Looking at stars.
 """)
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         builder = CanonBuilder(temp_project, config)
         result = builder.build()
 
@@ -198,7 +297,7 @@ INT. STUDIO - DAY
 ALEX records a podcast.
 """)
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         builder = CanonBuilder(temp_project, config)
         result = builder.build()
 
@@ -229,7 +328,7 @@ INT. OFFICE - DAY
 REBECCA meets CHARLES for the first time.
 """)
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         config["disambiguation"]["always_ask_new"] = True
 
         builder = CanonBuilder(temp_project, config)
@@ -251,11 +350,23 @@ REBECCA meets CHARLES for the first time.
         assert "kind" in item
         assert "label" in item
 
+    def test_build_json_bytes_independent_of_orjson(self, tmp_path, monkeypatch):
+        """Test that both JSON writers emit the same UTF-8 bytes."""
+        data = {"entities": [{"id": "CHAR_Zoe", "name": "Zoë Café", "aliases": ["Señor \"Z\""]}]}
+        canon._write_json(tmp_path / "fast.json", data)
+
+        monkeypatch.setattr(canon, "ORJSON_AVAILABLE", False)
+        canon._write_json(tmp_path / "stdlib.json", data)
+
+        raw = (tmp_path / "stdlib.json").read_bytes()
+        assert raw == (tmp_path / "fast.json").read_bytes()
+        assert json.loads(raw.decode("utf-8")) == data
+
 
 class TestExtractionPipeline:
     """Tests for the extraction pipeline components."""
 
-    def test_character_extraction_pipeline(self, temp_project):
+    def test_character_extraction_pipeline(self, temp_project, character_extractor):
         """Test character extraction from inbox files."""
         (temp_project / "inbox" / "chars.md").write_text("""
 INT. HOSPITAL - DAY
@@ -264,8 +375,7 @@ DR. SMITH consults with NURSE JENKINS.
 PATIENT JONES waits nervously.
 """)
 
-        extractor = CharacterExtractor()
-        candidates = extractor.extract_from_file(temp_project / "inbox" / "chars.md")
+        candidates = character_extractor.extract_from_file(temp_project / "inbox" / "chars.md")
 
         # Should extract character names
         assert len(candidates) >= 2
@@ -274,7 +384,7 @@ PATIENT JONES waits nervously.
         # At least some of these should be found
         assert any("SMITH" in n or "Smith" in n for n in names)
 
-    def test_location_extraction_pipeline(self, temp_project):
+    def test_location_extraction_pipeline(self, temp_project, location_extractor):
         """Test location extraction from inbox files."""
         (temp_project / "inbox" / "locs.md").write_text("""
 INT. WAREHOUSE - NIGHT
@@ -282,8 +392,7 @@ EXT. CITY STREETS - DAY
 INT./EXT. AIRPORT - MORNING
 """)
 
-        extractor = LocationExtractor()
-        candidates = extractor.extract_from_file(temp_project / "inbox" / "locs.md")
+        candidates = location_extractor.extract_from_file(temp_project / "inbox" / "locs.md")
 
         assert len(candidates) >= 3
 
@@ -291,7 +400,7 @@ INT./EXT. AIRPORT - MORNING
         for c in candidates:
             assert c.metadata.get("int_ext") in ("INT", "EXT", "INT/EXT", "I/E")
 
-    def test_scene_extractor_boundaries(self, temp_project):
+    def test_scene_extractor_boundaries(self, temp_project, scene_extractor):
         """Test scene boundary detection."""
         content = """INT. APARTMENT - DAY
 
@@ -306,8 +415,7 @@ CUT TO:
 INT. BEDROOM - NIGHT
 """
 
-        extractor = SceneExtractor()
-        boundaries = extractor.detect_boundaries(content, "test.md")
+        boundaries = scene_extractor.detect_boundaries(content, "test.md")
 
         assert len(boundaries) >= 3
 
@@ -389,7 +497,7 @@ INT. COURTROOM - DAY
 JUDGE WALKER presides. ^ev_a1b2
 """)
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         config["disambiguation"]["always_ask_new"] = False
 
         builder = CanonBuilder(temp_project, config)
@@ -415,36 +523,9 @@ class TestEndToEndIntegration:
         """Test complete canon build with vault note creation."""
         # Create inbox file with comprehensive screenplay content
         inbox_file = temp_project / "inbox" / "screenplay.md"
-        inbox_file.write_text("""# Test Screenplay
-
-INT. COFFEE SHOP - DAY
-
-JOHN sits at a corner table, reading a newspaper. ^ev_001
-
-MARY enters, looking around nervously. ^ev_002
-
-JOHN
-(waving)
-Over here, Mary!
-
-MARY walks to John's table and sits down. ^ev_003
-
-EXT. PARK - LATER
+        inbox_file.write_bytes(SCRIPT_E2E)
 
-John and Mary walk together through the park. ^ev_004
-
-JOHN
-It's a beautiful day.
-
-MARY
-I'm glad we finally met.
-
-EXT. CITY STREET - NIGHT
-
-JOHN walks alone down the empty street. ^ev_005
-""")
-
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         config["disambiguation"]["always_ask_new"] = False
 
         builder = CanonBuilder(temp_project, config)
@@ -496,7 +577,7 @@ EXT. ROOFTOP - NIGHT
 Alice and Bob look at the city lights. ^ev_d3
 """)
 
-        config = yaml.safe_load((temp_project / "gsd.yaml").read_text())
+        config = project_config()
         config["disambiguation"]["always_ask_new"] = False
 
         # First build
@@ -507,13 +588,11 @@ Alice and Bob look at the city lights. ^ev_d3
         # Capture first build output (excluding timestamps)
         storygraph1_path = temp_project / "build" / "storygraph.json"
         storygraph1 = json.loads(storygraph1_path.read_text())
-        # Remove timestamp fields for comparison
-        storygraph1_copy = json.loads(json.dumps(storygraph1))
 
         # Clear entities for second build (simulate fresh build)
         storygraph1_path.write_text(json.dumps({
             "version": "1.0",
-            "project_id": storygraph1_copy["project_id"],
+            "project_id": storygraph1["project_id"],
             "entities": [],
             "edges": [],
             "evidence_index": {}
@@ -527,23 +606,160 @@ Alice and Bob look at the city lights. ^ev_d3
         # Capture second build output
         storygraph2 = json.loads(storygraph1_path.read_text())
 
-        # Compare entity counts
-        assert len(storygraph1_copy["entities"]) == len(storygraph2["entities"])
+        def entity_identity(storygraph):
+            """Fields that must match across builds, in stored (sorted) order."""
+            return [
+                (e["id"], e["type"], e["name"], e.get("evidence_ids", []))
+                for e in storygraph["entities"]
+            ]
+
+        # One list comparison; pytest reports the differing entities on failure
+        assert entity_identity(storygraph1) == entity_identity(storygraph2)
 
-        # Compare entity IDs (should be same order due to sorting)
-        ids1 = [e["id"] for e in storygraph1_copy["entities"]]
-        ids2 = [e["id"] for e in storygraph2["entities"]]
-        assert ids1 == ids2, f"Entity IDs differ: {ids1} vs {ids2}"
+    def test_rebuild_skips_unchanged_inbox_files(self, temp_project):
+        """Test that a rebuild only reprocesses inbox files whose content changed."""
+        inbox_file = temp_project / "inbox" / "incremental.md"
+        inbox_file.write_text("""INT. OFFICE - DAY
 
-        # Compare entity types and names
-        for i, (e1, e2) in enumerate(zip(storygraph1_copy["entities"], storygraph2["entities"])):
-            assert e1["id"] == e2["id"], f"Entity {i} ID differs"
-            assert e1["type"] == e2["type"], f"Entity {i} type differs"
-            assert e1["name"] == e2["name"], f"Entity {i} name differs"
-            # Evidence IDs should be sorted the same way
-            assert e1.get("evidence_ids", []) == e2.get("evidence_ids", []), \
-                f"Entity {i} evidence_ids differ"
+ALICE types on her keyboard. ^ev_i1
+""")
 
+        config = project_config()
+        config["disambiguation"]["always_ask_new"] = False
 
-# Import yaml at module level
-import yaml
+        result1 = CanonBuilder(temp_project, config).build()
+        assert result1.files_skipped == 0
+        assert result1.scenes_created == 1
+
+        storygraph_path = temp_project / "build" / "storygraph.json"
+        storygraph = json.loads(storygraph_path.read_text())
+        assert list(storygraph["inbox_index"]) == ["inbox/incremental.md"]
+
+        # Unchanged content: nothing is re-extracted
+        result2 = CanonBuilder(temp_project, config).build()
+        assert result2.files_skipped == 1
+        assert result2.scenes_created == 0
+        assert json.loads(storygraph_path.read_text())["entities"] == storygraph["entities"]
+
+        # Changed content is processed again
+        inbox_file.write_text(inbox_file.read_text() + "\nEXT. ROOFTOP - NIGHT\n")
+        result3 = CanonBuilder(temp_project, config).build()
+        assert result3.files_skipped == 0
+        assert result3.scenes_created == 1
+
+        # The edited file's existing scene keeps its ID rather than repeating
+        scenes = [
+            (e["id"], e["attributes"]["location"])
+            for e in json.loads(storygraph_path.read_text())["entities"]
+            if e["type"] == "scene"
+        ]
+        assert scenes == [("SCN_001", "OFFICE"), ("SCN_002", "ROOFTOP")]
+
+    def test_rebuild_reprocesses_all_files_when_settings_change(self, temp_project, monkeypatch):
+        """Test that new resolution settings or extractors invalidate the inbox index."""
+        (temp_project / "inbox" / "settings.md").write_text("""INT. OFFICE - DAY
+
+ALICE types on her keyboard. ^ev_s1
+""")
+        config = project_config()
+        config["disambiguation"]["always_ask_new"] = False
+        CanonBuilder(temp_project, config).build()
+        assert CanonBuilder(temp_project, config).build().files_skipped == 1
+
+        config["disambiguation"]["auto_accept"] = 0.9
+        assert CanonBuilder(temp_project, config).build().files_skipped == 0
+        assert CanonBuilder(temp_project, config).build().files_skipped == 1
+
+        monkeypatch.setattr(canon, "EXTRACTION_VERSION", canon.EXTRACTION_VERSION + 1)
+        result = CanonBuilder(temp_project, config).build()
+        assert result.files_skipped == 0
+        assert result.scenes_created == 0
+
+    def test_extraction_workers_gate(self, temp_project, monkeypatch):
+        """Test that small inboxes and single-CPU hosts extract in process."""
+        inbox_files = []
+        for i in range(3):
+            inbox_file = temp_project / "inbox" / f"part_{i}.md"
+            inbox_file.write_bytes(b"x" * 1000)
+            inbox_files.append(inbox_file)
+        builder = CanonBuilder(temp_project, project_config())
+
+        monkeypatch.setattr(canon.os, "cpu_count", lambda: 16)
+        assert builder._extraction_workers(inbox_files) == 1
+
+        monkeypatch.setattr(canon, "PARALLEL_EXTRACTION_MIN_BYTES", 3000)
+        assert builder._extraction_workers(inbox_files) == 3
+
+        monkeypatch.setattr(canon.os, "cpu_count", lambda: 2)
+        assert builder._extraction_workers(inbox_files) == 2
+
+        monkeypatch.setattr(canon.os, "cpu_count", lambda: 1)
+        assert builder._extraction_workers(inbox_files) == 1
+
+    def test_parallel_extraction_matches_sequential(self, temp_project, tmp_path, monkeypatch, worker_extraction):
+        """Test that worker-process extraction builds the same storygraph."""
+        file_count = 4
+        for i in range(file_count):
+            (temp_project / "inbox" / f"part_{i}.md").write_text(f"""INT. ROOM {"ABCDEFGH"[i]} - DAY
+
+ALICE talks to BOB. ^ev_p{i}a
+
+Carol's Diner is busy. ^ev_p{i}b
+""")
+        sequential_project = tmp_path / "sequential"
+        shutil.copytree(temp_project, sequential_project)
+
+        config = project_config()
+        config["disambiguation"]["always_ask_new"] = False
+
+        parallel = CanonBuilder(temp_project, config).build()
+        assert worker_extraction == [2]
+
+        monkeypatch.setattr(canon.os, "cpu_count", lambda: 1)
+        sequential = CanonBuilder(sequential_project, config).build()
+        assert worker_extraction == [2]
+
+        assert parallel == sequential
+        assert parallel.characters_linked > 0
+        assert parallel.scenes_created == file_count
+
+        def entities(project):
+            storygraph = json.loads((project / "build" / "storygraph.json").read_text())
+            return [
+                (e["id"], e["name"], e.get("evidence_ids", []))
+                for e in storygraph["entities"]
+            ]
+
+        assert entities(temp_project) == entities(sequential_project)
+
+    def test_parallel_extraction_collects_file_errors(self, temp_project, tmp_path, monkeypatch, worker_extraction):
+        """Test that a file failing in a worker is reported, not fatal."""
+        file_count = 4
+        for i in range(file_count):
+            (temp_project / "inbox" / f"part_{i}.md").write_text(f"""INT. ROOM {"ABCDEFGH"[i]} - DAY
+
+ALICE talks to BOB. ^ev_p{i}a
+""")
+        (temp_project / "inbox" / "broken.md").write_bytes(b"INT. ROOM \xff - DAY\n")
+        sequential_project = tmp_path / "sequential"
+        shutil.copytree(temp_project, sequential_project)
+
+        config = project_config()
+        config["disambiguation"]["always_ask_new"] = False
+
+        parallel = CanonBuilder(temp_project, config).build()
+        assert worker_extraction == [2]
+
+        monkeypatch.setattr(canon.os, "cpu_count", lambda: 1)
+        sequential = CanonBuilder(sequential_project, config).build()
+        assert worker_extraction == [2]
+
+        assert len(parallel.errors) == 1
+        assert "broken.md" in parallel.errors[0]
+        assert parallel.scenes_created == file_count
+        assert [e.replace(str(temp_project), "") for e in parallel.errors] == [
+            e.replace(str(sequential_project), "") for e in sequential.errors
+        ]
+
+        storygraph = json.loads((temp_project / "build" / "storygraph.json").read_text())
+        assert "inbox/broken.md" not in storygraph["inbox_index"]
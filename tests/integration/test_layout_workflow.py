@@ -10,11 +10,17 @@ Tests the complete workflow:
 7. Verify combined brief in build/
 """
 import json
-import tempfile
 from pathlib import Path
+from typing import Dict
 
 import pytest
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from core.layout import (
     LayoutBriefGenerator,
     LayoutBriefExporter,
@@ -24,117 +30,178 @@ from core.layout import (
 )
 
 
+# Version header for the small graphs built inline by edge-case tests
+GRAPH_HEADER = {"version": "1.0", "project_id": "test"}
+
+
+# Two scenes with four shots, shared by the full workflow tests
+SCRIPTGRAPH = {
+    "version": "1.0",
+    "project_id": "test-project",
+    "scenes": [
+        {
+            "id": "SCN_001",
+            "order": 1,
+            "slugline": "INT. OFFICE - DAY",
+            "int_ext": "INT",
+            "time_of_day": "DAY",
+            "links": {
+                "characters": ["CHAR_alice"],
+                "locations": ["LOC_office"],
+                "evidence_ids": ["EV_001"],
+            },
+        },
+        {
+            "id": "SCN_002",
+            "order": 2,
+            "slugline": "EXT. PARK - NIGHT",
+            "int_ext": "EXT",
+            "time_of_day": "NIGHT",
+            "links": {
+                "characters": ["CHAR_bob", "CHAR_charlie"],
+                "locations": ["LOC_park"],
+                "evidence_ids": ["EV_002"],
+            },
+        },
+    ],
+}
+
+SHOTGRAPH = {
+    "version": "1.0",
+    "project_id": "test-project",
+    "shots": [
+        {
+            "shot_id": "shot_001_001",
+            "scene_id": "SCN_001",
+            "scene_number": 1,
+            "shot_number": 1,
+            "shot_type": "WS",
+            "movement": "Static",
+            "description": "Establishing shot",
+            "evidence_ids": [],
+        },
+        {
+            "shot_id": "shot_001_002",
+            "scene_id": "SCN_001",
+            "scene_number": 1,
+            "shot_number": 2,
+            "shot_type": "CU",
+            "movement": "Static",
+            "description": "Close-up on Alice",
+            "evidence_ids": ["EV_003"],
+        },
+        {
+            "shot_id": "shot_002_001",
+            "scene_id": "SCN_002",
+            "scene_number": 2,
+            "shot_number": 1,
+            "shot_type": "MS",
+            "movement": "Pan",
+            "description": "Bob and Charlie talk",
+            "evidence_ids": [],
+        },
+        {
+            "shot_id": "shot_002_002",
+            "scene_id": "SCN_002",
+            "scene_number": 2,
+            "shot_number": 2,
+            "shot_type": "OTS",
+            "movement": "Static",
+            "description": "Over Bob's shoulder",
+            "evidence_ids": [],
+        },
+    ],
+}
+
+
+def _dump(obj) -> bytes:
+    """Serialize a graph fixture to compact UTF-8 JSON."""
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _load(path: Path):
+    """Parse an exported JSON file straight from its bytes."""
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _index_setups(scene: SceneLayout) -> Dict[str, CameraSetup]:
+    """Map shot type to its first camera setup in a scene."""
+    setups: Dict[str, CameraSetup] = {}
+    for setup in scene.camera_setups:
+        setups.setdefault(setup.shot_type, setup)
+    return setups
+
+
+def write_project(project_path: Path, scriptgraph: dict, shotgraph: dict) -> Path:
+    """Write a ScriptGraph and ShotGraph into a project; returns the build path."""
+    build_path = project_path / "build"
+    build_path.mkdir()
+    (build_path / "scriptgraph.json").write_bytes(_dump(scriptgraph))
+    (build_path / "shotgraph.json").write_bytes(_dump(shotgraph))
+    return build_path
+
+
+def write_project_with_data(project_path: Path) -> dict:
+    """Write the ScriptGraph and ShotGraph fixtures into a project."""
+    build_path = write_project(project_path, SCRIPTGRAPH, SHOTGRAPH)
+    return {
+        "project_path": project_path,
+        "build_path": build_path,
+        "scriptgraph": SCRIPTGRAPH,
+        "shotgraph": SHOTGRAPH,
+    }
+
+
+def generate_layout(project_path: Path, scenes: list, shots: list) -> LayoutBrief:
+    """Write single-purpose scene and shot graphs, then generate their brief."""
+    build_path = write_project(
+        project_path,
+        {**GRAPH_HEADER, "scenes": scenes},
+        {**GRAPH_HEADER, "shots": shots},
+    )
+    return LayoutBriefGenerator(build_path).generate()
+
+
+@pytest.fixture(scope="module")
+def shared_project(tmp_path_factory):
+    """Create one test project shared by the read-only workflow tests."""
+    return write_project_with_data(tmp_path_factory.mktemp("layout"))
+
+
+@pytest.fixture(scope="module")
+def generated_brief(shared_project):
+    """Generate the layout brief once for the read-only workflow tests."""
+    return LayoutBriefGenerator(shared_project["build_path"]).generate()
+
+
+@pytest.fixture(scope="module")
+def scenes_by_id(generated_brief):
+    """Index the shared brief's scene layouts by scene ID."""
+    return {s.scene_id: s for s in generated_brief.scene_layouts}
+
+
+@pytest.fixture(scope="module")
+def exported_paths(shared_project, generated_brief):
+    """Export the shared brief once; maps scene_id -> layout_brief.json."""
+    return LayoutBriefExporter(shared_project["project_path"]).export(generated_brief)
+
+
 class TestFullLayoutWorkflow:
     """End-to-end layout workflow tests."""
 
     @pytest.fixture
-    def project_with_data(self):
-        """Create a test project with ScriptGraph and ShotGraph."""
-        # Create project structure
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            build_path = project_path / "build"
-            build_path.mkdir()
-
-            # Create ScriptGraph
-            scriptgraph = {
-                "version": "1.0",
-                "project_id": "test-project",
-                "scenes": [
-                    {
-                        "id": "SCN_001",
-                        "order": 1,
-                        "slugline": "INT. OFFICE - DAY",
-                        "int_ext": "INT",
-                        "time_of_day": "DAY",
-                        "links": {
-                            "characters": ["CHAR_alice"],
-                            "locations": ["LOC_office"],
-                            "evidence_ids": ["EV_001"],
-                        },
-                    },
-                    {
-                        "id": "SCN_002",
-                        "order": 2,
-                        "slugline": "EXT. PARK - NIGHT",
-                        "int_ext": "EXT",
-                        "time_of_day": "NIGHT",
-                        "links": {
-                            "characters": ["CHAR_bob", "CHAR_charlie"],
-                            "locations": ["LOC_park"],
-                            "evidence_ids": ["EV_002"],
-                        },
-                    },
-                ],
-            }
-            (build_path / "scriptgraph.json").write_text(json.dumps(scriptgraph))
-
-            # Create ShotGraph
-            shotgraph = {
-                "version": "1.0",
-                "project_id": "test-project",
-                "shots": [
-                    {
-                        "shot_id": "shot_001_001",
-                        "scene_id": "SCN_001",
-                        "scene_number": 1,
-                        "shot_number": 1,
-                        "shot_type": "WS",
-                        "movement": "Static",
-                        "description": "Establishing shot",
-                        "evidence_ids": [],
-                    },
-                    {
-                        "shot_id": "shot_001_002",
-                        "scene_id": "SCN_001",
-                        "scene_number": 1,
-                        "shot_number": 2,
-                        "shot_type": "CU",
-                        "movement": "Static",
-                        "description": "Close-up on Alice",
-                        "evidence_ids": ["EV_003"],
-                    },
-                    {
-                        "shot_id": "shot_002_001",
-                        "scene_id": "SCN_002",
-                        "scene_number": 2,
-                        "shot_number": 1,
-                        "shot_type": "MS",
-                        "movement": "Pan",
-                        "description": "Bob and Charlie talk",
-                        "evidence_ids": [],
-                    },
-                    {
-                        "shot_id": "shot_002_002",
-                        "scene_id": "SCN_002",
-                        "scene_number": 2,
-                        "shot_number": 2,
-                        "shot_type": "OTS",
-                        "movement": "Static",
-                        "description": "Over Bob's shoulder",
-                        "evidence_ids": [],
-                    },
-                ],
-            }
-            (build_path / "shotgraph.json").write_text(json.dumps(shotgraph))
+    def project_with_data(self, tmp_path):
+        """Create a fresh test project for tests that export into it."""
+        return write_project_with_data(tmp_path)
 
-            yield {
-                "project_path": project_path,
-                "build_path": build_path,
-                "scriptgraph": scriptgraph,
-                "shotgraph": shotgraph,
-            }
-
-    def test_generate_layout_creates_brief(self, project_with_data):
+    def test_generate_layout_creates_brief(self, generated_brief):
         """Test that generate() creates valid LayoutBrief."""
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
-        assert isinstance(brief, LayoutBrief)
-        assert brief.project_id == "test-project"
-        assert len(brief.scene_layouts) == 2
+        assert isinstance(generated_brief, LayoutBrief)
+        assert generated_brief.project_id == "test-project"
+        assert len(generated_brief.scene_layouts) == 2
 
     def test_generate_layout_creates_files(self, project_with_data):
         """Test that generate-layout creates output files."""
@@ -155,45 +222,26 @@ class TestFullLayoutWorkflow:
         assert paths["SCN_001"].exists()
         assert paths["SCN_002"].exists()
 
-    def test_layout_brief_json_valid(self, project_with_data):
+    def test_layout_brief_json_valid(self, exported_paths):
         """Test that output JSON is valid."""
-        project_path = project_with_data["project_path"]
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
-        exporter = LayoutBriefExporter(project_path)
-        paths = exporter.export(brief)
-
         # Verify JSON is valid
-        for scene_id, path in paths.items():
-            data = json.loads(path.read_text())
+        for scene_id, path in exported_paths.items():
+            data = _load(path)
             assert "scene_id" in data
             assert "camera_setups" in data
             assert "characters" in data
 
-    def test_camera_setups_present(self, project_with_data):
+    def test_camera_setups_present(self, scenes_by_id):
         """Test that camera setups are generated."""
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
-        scene = next(s for s in brief.scene_layouts if s.scene_id == "SCN_001")
+        scene = scenes_by_id["SCN_001"]
         assert len(scene.camera_setups) == 2  # 2 shots in fixture
 
-        scene2 = next(s for s in brief.scene_layouts if s.scene_id == "SCN_002")
+        scene2 = scenes_by_id["SCN_002"]
         assert len(scene2.camera_setups) == 2  # 2 shots in fixture
 
-    def test_camera_positions_valid(self, project_with_data):
+    def test_camera_positions_valid(self, generated_brief):
         """Test that camera positions have valid coordinates."""
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
-        for scene in brief.scene_layouts:
+        for scene in generated_brief.scene_layouts:
             for cam in scene.camera_setups:
                 pos = cam.camera["position"]
                 assert "x" in pos
@@ -203,36 +251,26 @@ class TestFullLayoutWorkflow:
                 assert isinstance(pos["y"], (int, float))
                 assert isinstance(pos["z"], (int, float))
 
-    def test_camera_distances_by_shot_type(self, project_with_data):
+    def test_camera_distances_by_shot_type(self, scenes_by_id):
         """Test that camera distances match shot types."""
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
         # SCN_001: WS (5m), CU (1.2m)
-        scene = next(s for s in brief.scene_layouts if s.scene_id == "SCN_001")
+        setups = _index_setups(scenes_by_id["SCN_001"])
 
-        ws_cam = next(c for c in scene.camera_setups if c.shot_type == "WS")
+        ws_cam = setups["WS"]
         # WS should be ~5m from subject (negative Y)
         assert abs(ws_cam.camera["position"]["y"]) > 4.0
 
-        cu_cam = next(c for c in scene.camera_setups if c.shot_type == "CU")
+        cu_cam = setups["CU"]
         # CU should be ~1.2m from subject
         assert abs(cu_cam.camera["position"]["y"]) < 2.0
 
-    def test_characters_present(self, project_with_data):
+    def test_characters_present(self, scenes_by_id):
         """Test that characters are in scene layouts."""
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
-        scene1 = next(s for s in brief.scene_layouts if s.scene_id == "SCN_001")
+        scene1 = scenes_by_id["SCN_001"]
         assert len(scene1.characters) == 1
         assert scene1.characters[0].character_id == "CHAR_alice"
 
-        scene2 = next(s for s in brief.scene_layouts if s.scene_id == "SCN_002")
+        scene2 = scenes_by_id["SCN_002"]
         assert len(scene2.characters) == 2
         char_ids = [c.character_id for c in scene2.characters]
         assert "CHAR_bob" in char_ids
@@ -253,7 +291,7 @@ class TestFullLayoutWorkflow:
         combined_path = build_path / "layout_brief.json"
         assert combined_path.exists()
 
-        data = json.loads(combined_path.read_text())
+        data = _load(combined_path)
         assert data["project_id"] == "test-project"
         assert len(data["scene_layouts"]) == 2
 
@@ -276,41 +314,31 @@ class TestFullLayoutWorkflow:
         assert (blender_path / "SCN_001" / "layout_brief.json").exists()
         assert (blender_path / "SCN_002" / "layout_brief.json").exists()
 
-    def test_evidence_chain_preserved(self, project_with_data):
+    def test_evidence_chain_preserved(self, scenes_by_id):
         """Test that evidence IDs are preserved through the pipeline."""
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
         # Scene evidence
-        scene1 = next(s for s in brief.scene_layouts if s.scene_id == "SCN_001")
+        scene1 = scenes_by_id["SCN_001"]
         assert "EV_001" in scene1.evidence_ids
 
         # Camera (shot) evidence
-        cu_cam = next(c for c in scene1.camera_setups if c.shot_type == "CU")
+        cu_cam = _index_setups(scene1)["CU"]
         assert "EV_003" in cu_cam.evidence_ids
 
-    def test_environment_metadata(self, project_with_data):
+    def test_environment_metadata(self, scenes_by_id):
         """Test that environment metadata is included."""
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
-        scene1 = next(s for s in brief.scene_layouts if s.scene_id == "SCN_001")
+        scene1 = scenes_by_id["SCN_001"]
         assert scene1.int_ext == "INT"
         assert scene1.time_of_day == "DAY"
         assert scene1.environment["lighting_preset"] == "interior_day"
 
-        scene2 = next(s for s in brief.scene_layouts if s.scene_id == "SCN_002")
+        scene2 = scenes_by_id["SCN_002"]
         assert scene2.int_ext == "EXT"
         assert scene2.time_of_day == "NIGHT"
         assert scene2.environment["lighting_preset"] == "outdoor_night"
 
-    def test_deterministic_output(self, project_with_data):
+    def test_deterministic_output(self, shared_project):
         """Test that generation is deterministic."""
-        build_path = project_with_data["build_path"]
+        build_path = shared_project["build_path"]
 
         # First run
         generator1 = LayoutBriefGenerator(build_path)
@@ -329,292 +357,206 @@ class TestFullLayoutWorkflow:
             assert len(s1.camera_setups) == len(s2.camera_setups)
             assert len(s1.characters) == len(s2.characters)
 
-    def test_json_output_sorted_keys(self, project_with_data):
+    def test_json_output_sorted_keys(self, exported_paths):
         """Test that JSON output has sorted keys for determinism."""
-        project_path = project_with_data["project_path"]
-        build_path = project_with_data["build_path"]
-
-        generator = LayoutBriefGenerator(build_path)
-        brief = generator.generate()
-
-        exporter = LayoutBriefExporter(project_path)
-        paths = exporter.export(brief)
-
-        # Read raw JSON
-        raw = paths["SCN_001"].read_text()
-
-        # Should be valid JSON with sorted keys
-        data = json.loads(raw)
+        # Parsing keeps file order, so sorted keys read back sorted
+        data = _load(exported_paths["SCN_001"])
         assert isinstance(data, dict)
+        assert list(data) == sorted(data)
 
 
 class TestEdgeCases:
     """Edge case tests for layout workflow."""
 
-    def test_scene_with_no_characters(self):
+    def test_scene_with_no_characters(self, tmp_path):
         """Scene with no characters still creates layout."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            build_path = project_path / "build"
-            build_path.mkdir()
-
-            scriptgraph = {
-                "version": "1.0",
-                "project_id": "test",
-                "scenes": [
-                    {
-                        "id": "SCN_001",
-                        "order": 1,
-                        "slugline": "EXT. EMPTY FIELD - DAY",
-                        "int_ext": "EXT",
-                        "time_of_day": "DAY",
-                        "links": {"characters": [], "locations": [], "evidence_ids": []},
-                    }
-                ],
+        scenes = [
+            {
+                "id": "SCN_001",
+                "order": 1,
+                "slugline": "EXT. EMPTY FIELD - DAY",
+                "int_ext": "EXT",
+                "time_of_day": "DAY",
+                "links": {"characters": [], "locations": [], "evidence_ids": []},
             }
-            (build_path / "scriptgraph.json").write_text(json.dumps(scriptgraph))
-
-            shotgraph = {
-                "version": "1.0",
-                "project_id": "test",
-                "shots": [
-                    {
-                        "shot_id": "shot_001_001",
-                        "scene_id": "SCN_001",
-                        "scene_number": 1,
-                        "shot_number": 1,
-                        "shot_type": "WS",
-                        "movement": "Static",
-                        "description": "Empty field",
-                        "evidence_ids": [],
-                    }
-                ],
+        ]
+
+        shots = [
+            {
+                "shot_id": "shot_001_001",
+                "scene_id": "SCN_001",
+                "scene_number": 1,
+                "shot_number": 1,
+                "shot_type": "WS",
+                "movement": "Static",
+                "description": "Empty field",
+                "evidence_ids": [],
             }
-            (build_path / "shotgraph.json").write_text(json.dumps(shotgraph))
+        ]
 
-            generator = LayoutBriefGenerator(build_path)
-            brief = generator.generate()
+        brief = generate_layout(tmp_path, scenes, shots)
 
-            assert len(brief.scene_layouts) == 1
-            assert len(brief.scene_layouts[0].characters) == 0
-            assert len(brief.scene_layouts[0].camera_setups) == 1
+        assert len(brief.scene_layouts) == 1
+        assert len(brief.scene_layouts[0].characters) == 0
+        assert len(brief.scene_layouts[0].camera_setups) == 1
 
-    def test_scene_with_no_shots(self):
+    def test_scene_with_no_shots(self, tmp_path):
         """Scene with no shots creates layout with no cameras."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            build_path = project_path / "build"
-            build_path.mkdir()
-
-            scriptgraph = {
-                "version": "1.0",
-                "project_id": "test",
-                "scenes": [
-                    {
-                        "id": "SCN_001",
-                        "order": 1,
-                        "slugline": "INT. ROOM - DAY",
-                        "int_ext": "INT",
-                        "time_of_day": "DAY",
-                        "links": {
-                            "characters": ["CHAR_x"],
-                            "locations": [],
-                            "evidence_ids": [],
-                        },
-                    }
-                ],
+        scenes = [
+            {
+                "id": "SCN_001",
+                "order": 1,
+                "slugline": "INT. ROOM - DAY",
+                "int_ext": "INT",
+                "time_of_day": "DAY",
+                "links": {
+                    "characters": ["CHAR_x"],
+                    "locations": [],
+                    "evidence_ids": [],
+                },
             }
-            (build_path / "scriptgraph.json").write_text(json.dumps(scriptgraph))
+        ]
 
-            shotgraph = {"version": "1.0", "project_id": "test", "shots": []}
-            (build_path / "shotgraph.json").write_text(json.dumps(shotgraph))
+        brief = generate_layout(tmp_path, scenes, [])
 
-            generator = LayoutBriefGenerator(build_path)
-            brief = generator.generate()
+        assert len(brief.scene_layouts) == 1
+        assert len(brief.scene_layouts[0].camera_setups) == 0
 
-            assert len(brief.scene_layouts) == 1
-            assert len(brief.scene_layouts[0].camera_setups) == 0
-
-    def test_all_shot_types(self):
+    def test_all_shot_types(self, tmp_path):
         """Test all shot types produce valid camera positions."""
         shot_types = ["WS", "MS", "MCU", "CU", "ECU", "INSERT", "OTS", "POV", "TWO"]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            build_path = project_path / "build"
-            build_path.mkdir()
-
-            scriptgraph = {
-                "version": "1.0",
-                "project_id": "test",
-                "scenes": [
-                    {
-                        "id": "SCN_001",
-                        "order": 1,
-                        "slugline": "INT. STUDIO - DAY",
-                        "int_ext": "INT",
-                        "time_of_day": "DAY",
-                        "links": {
-                            "characters": ["CHAR_x"],
-                            "locations": [],
-                            "evidence_ids": [],
-                        },
-                    }
-                ],
+        scenes = [
+            {
+                "id": "SCN_001",
+                "order": 1,
+                "slugline": "INT. STUDIO - DAY",
+                "int_ext": "INT",
+                "time_of_day": "DAY",
+                "links": {
+                    "characters": ["CHAR_x"],
+                    "locations": [],
+                    "evidence_ids": [],
+                },
             }
-            (build_path / "scriptgraph.json").write_text(json.dumps(scriptgraph))
-
-            shots = []
-            for i, shot_type in enumerate(shot_types, 1):
-                shots.append(
-                    {
-                        "shot_id": f"shot_001_{i:03d}",
-                        "scene_id": "SCN_001",
-                        "scene_number": 1,
-                        "shot_number": i,
-                        "shot_type": shot_type,
-                        "movement": "Static",
-                        "description": f"{shot_type} test",
-                        "evidence_ids": [],
-                    }
-                )
-
-            shotgraph = {"version": "1.0", "project_id": "test", "shots": shots}
-            (build_path / "shotgraph.json").write_text(json.dumps(shotgraph))
-
-            generator = LayoutBriefGenerator(build_path)
-            brief = generator.generate()
-
-            assert len(brief.scene_layouts[0].camera_setups) == 9
-
-            # Verify each camera setup
-            for cam in brief.scene_layouts[0].camera_setups:
-                assert cam.shot_type in shot_types
-                pos = cam.camera["position"]
-                assert isinstance(pos["x"], (int, float))
-                assert isinstance(pos["y"], (int, float))
-                assert isinstance(pos["z"], (int, float))
+        ]
+
+        shots = [
+            {
+                "shot_id": f"shot_001_{i:03d}",
+                "scene_id": "SCN_001",
+                "scene_number": 1,
+                "shot_number": i,
+                "shot_type": shot_type,
+                "movement": "Static",
+                "description": f"{shot_type} test",
+                "evidence_ids": [],
+            }
+            for i, shot_type in enumerate(shot_types, 1)
+        ]
 
-    def test_many_scenes(self):
-        """Handles many scenes efficiently."""
-        scenes = []
-        shots = []
-
-        for i in range(1, 51):  # 50 scenes
-            scenes.append(
-                {
-                    "id": f"SCN_{i:03d}",
-                    "order": i,
-                    "slugline": f"INT. LOCATION {i} - DAY",
-                    "int_ext": "INT",
-                    "time_of_day": "DAY",
-                    "links": {
-                        "characters": [f"CHAR_{i}"],
-                        "locations": [f"LOC_{i}"],
-                        "evidence_ids": [],
-                    },
-                }
-            )
-            shots.append(
-                {
-                    "shot_id": f"shot_{i:03d}_001",
-                    "scene_id": f"SCN_{i:03d}",
-                    "scene_number": i,
-                    "shot_number": 1,
-                    "shot_type": "WS",
-                    "movement": "Static",
-                    "description": f"Scene {i}",
-                    "evidence_ids": [],
-                }
-            )
+        brief = generate_layout(tmp_path, scenes, shots)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            build_path = project_path / "build"
-            build_path.mkdir()
+        assert len(brief.scene_layouts[0].camera_setups) == 9
 
-            scriptgraph = {"version": "1.0", "project_id": "test", "scenes": scenes}
-            (build_path / "scriptgraph.json").write_text(json.dumps(scriptgraph))
+        # Verify each camera setup
+        for cam in brief.scene_layouts[0].camera_setups:
+            assert cam.shot_type in shot_types
+            pos = cam.camera["position"]
+            assert isinstance(pos["x"], (int, float))
+            assert isinstance(pos["y"], (int, float))
+            assert isinstance(pos["z"], (int, float))
 
-            shotgraph = {"version": "1.0", "project_id": "test", "shots": shots}
-            (build_path / "shotgraph.json").write_text(json.dumps(shotgraph))
+    def test_many_scenes(self, tmp_path):
+        """Handles many scenes efficiently."""
+        scenes = [
+            {
+                "id": f"SCN_{i:03d}",
+                "order": i,
+                "slugline": f"INT. LOCATION {i} - DAY",
+                "int_ext": "INT",
+                "time_of_day": "DAY",
+                "links": {
+                    "characters": [f"CHAR_{i}"],
+                    "locations": [f"LOC_{i}"],
+                    "evidence_ids": [],
+                },
+            }
+            for i in range(1, 51)  # 50 scenes
+        ]
+        shots = [
+            {
+                "shot_id": f"shot_{i:03d}_001",
+                "scene_id": f"SCN_{i:03d}",
+                "scene_number": i,
+                "shot_number": 1,
+                "shot_type": "WS",
+                "movement": "Static",
+                "description": f"Scene {i}",
+                "evidence_ids": [],
+            }
+            for i in range(1, 51)
+        ]
 
-            generator = LayoutBriefGenerator(build_path)
-            brief = generator.generate()
+        brief = generate_layout(tmp_path, scenes, shots)
 
-            assert len(brief.scene_layouts) == 50
+        assert len(brief.scene_layouts) == 50
 
-            # Export and verify
-            exporter = LayoutBriefExporter(project_path)
-            paths = exporter.export(brief)
+        # Export and verify
+        exporter = LayoutBriefExporter(tmp_path)
+        paths = exporter.export(brief)
 
-            assert len(paths) == 50
+        assert len(paths) == 50
 
 
 class TestCameraMathIntegration:
     """Tests for camera math integration in layout workflow."""
 
-    def test_camera_height_varies_by_shot_type(self):
+    def test_camera_height_varies_by_shot_type(self, tmp_path):
         """Test that camera height varies correctly for shot types."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            build_path = project_path / "build"
-            build_path.mkdir()
-
-            scriptgraph = {
-                "version": "1.0",
-                "project_id": "test",
-                "scenes": [
-                    {
-                        "id": "SCN_001",
-                        "order": 1,
-                        "slugline": "INT. SET - DAY",
-                        "int_ext": "INT",
-                        "time_of_day": "DAY",
-                        "links": {"characters": ["CHAR_x"], "locations": [], "evidence_ids": []},
-                    }
-                ],
-            }
-            (build_path / "scriptgraph.json").write_text(json.dumps(scriptgraph))
-
-            shotgraph = {
-                "version": "1.0",
-                "project_id": "test",
-                "shots": [
-                    {
-                        "shot_id": "shot_001_001",
-                        "scene_id": "SCN_001",
-                        "scene_number": 1,
-                        "shot_number": 1,
-                        "shot_type": "WS",
-                        "movement": "Static",
-                        "description": "Wide shot",
-                        "evidence_ids": [],
-                    },
-                    {
-                        "shot_id": "shot_001_002",
-                        "scene_id": "SCN_001",
-                        "scene_number": 1,
-                        "shot_number": 2,
-                        "shot_type": "CU",
-                        "movement": "Static",
-                        "description": "Close-up",
-                        "evidence_ids": [],
-                    },
-                ],
+        scenes = [
+            {
+                "id": "SCN_001",
+                "order": 1,
+                "slugline": "INT. SET - DAY",
+                "int_ext": "INT",
+                "time_of_day": "DAY",
+                "links": {"characters": ["CHAR_x"], "locations": [], "evidence_ids": []},
             }
-            (build_path / "shotgraph.json").write_text(json.dumps(shotgraph))
-
-            generator = LayoutBriefGenerator(build_path)
-            brief = generator.generate()
-
-            scene = brief.scene_layouts[0]
-
-            ws_cam = next(c for c in scene.camera_setups if c.shot_type == "WS")
-            cu_cam = next(c for c in scene.camera_setups if c.shot_type == "CU")
-
-            # WS should use raised camera (2.0m)
-            assert ws_cam.camera["position"]["z"] > 1.8
-
-            # CU should use eye level (1.6m)
-            assert abs(cu_cam.camera["position"]["z"] - 1.6) < 0.1
+        ]
+
+        shots = [
+            {
+                "shot_id": "shot_001_001",
+                "scene_id": "SCN_001",
+                "scene_number": 1,
+                "shot_number": 1,
+                "shot_type": "WS",
+                "movement": "Static",
+                "description": "Wide shot",
+                "evidence_ids": [],
+            },
+            {
+                "shot_id": "shot_001_002",
+                "scene_id": "SCN_001",
+                "scene_number": 1,
+                "shot_number": 2,
+                "shot_type": "CU",
+                "movement": "Static",
+                "description": "Close-up",
+                "evidence_ids": [],
+            },
+        ]
+
+        brief = generate_layout(tmp_path, scenes, shots)
+
+        setups = _index_setups(brief.scene_layouts[0])
+
+        ws_cam = setups["WS"]
+        cu_cam = setups["CU"]
+
+        # WS should use raised camera (2.0m)
+        assert ws_cam.camera["position"]["z"] > 1.8
+
+        # CU should use eye level (1.6m)
+        assert abs(cu_cam.camera["position"]["z"] - 1.6) < 0.1
@@ -3,8 +3,6 @@
 Tests the full flow: storygraph → validation → reports → issues.json
 """
 import json
-import tempfile
-import shutil
 from pathlib import Path
 import pytest
 
@@ -17,10 +15,18 @@ from core.validation import (
 )
 
 
+def write_project(temp_dir: Path, storygraph: dict) -> Path:
+    """Create build and report directories and write the storygraph."""
+    (temp_dir / "build").mkdir(parents=True, exist_ok=True)
+    (temp_dir / "vault" / "80_Reports").mkdir(parents=True, exist_ok=True)
+    (temp_dir / "build" / "storygraph.json").write_text(json.dumps(storygraph))
+    return temp_dir
+
+
 @pytest.fixture
-def temp_project_with_storygraph():
+def temp_project_with_storygraph(tmp_path):
     """Create a temporary project with comprehensive storygraph for testing."""
-    temp_dir = Path(tempfile.mkdtemp())
+    temp_dir = tmp_path
 
     # Create directories
     (temp_dir / "build").mkdir(parents=True)
@@ -193,10 +199,7 @@ def temp_project_with_storygraph():
     }
 
     (temp_dir / "build" / "storygraph.json").write_text(json.dumps(storygraph, indent=2))
-    yield temp_dir
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return temp_dir
 
 
 class TestValidationPipelineE2E:
@@ -320,12 +323,8 @@ class TestValidationPipelineE2E:
 class TestValidationReportGeneration:
     """Tests for report generation."""
 
-    def test_empty_report_when_no_issues(self):
+    def test_empty_report_when_no_issues(self, tmp_path):
         """Test that empty report is generated when no issues."""
-        temp_dir = Path(tempfile.mkdtemp())
-        (temp_dir / "build").mkdir(parents=True)
-        (temp_dir / "vault" / "80_Reports").mkdir(parents=True)
-
         # Create minimal storygraph with no issues
         storygraph = {
             "version": "1.0",
@@ -337,23 +336,20 @@ class TestValidationReportGeneration:
             "edges": [],
             "evidence_index": {},
         }
-        (temp_dir / "build" / "storygraph.json").write_text(json.dumps(storygraph))
+        temp_dir = write_project(tmp_path, storygraph)
 
-        try:
-            orchestrator = ValidationOrchestrator(temp_dir)
-            result = orchestrator.run_validation()
+        orchestrator = ValidationOrchestrator(temp_dir)
+        result = orchestrator.run_validation()
 
-            # Should succeed with no issues
-            assert result["success"] is True
-            assert result["total_issues"] == 0
+        # Should succeed with no issues
+        assert result["success"] is True
+        assert result["total_issues"] == 0
 
-            # Should have empty report
-            summary_path = temp_dir / "vault" / "80_Reports" / "validation-summary.md"
-            assert summary_path.exists()
-            content = summary_path.read_text()
-            assert "No issues" in content or "0" in content
-        finally:
-            shutil.rmtree(temp_dir)
+        # Should have empty report
+        summary_path = temp_dir / "vault" / "80_Reports" / "validation-summary.md"
+        assert summary_path.exists()
+        content = summary_path.read_text()
+        assert "No issues" in content or "0" in content
 
     def test_reports_sorted_by_severity(self, temp_project_with_storygraph):
         """Test that issues in reports are sorted by severity."""
@@ -476,12 +472,8 @@ class TestValidationSummary:
 class TestValidationWithMinimalData:
     """Tests with minimal or edge-case data."""
 
-    def test_validation_with_single_scene(self):
+    def test_validation_with_single_scene(self, tmp_path):
         """Test validation with only one scene."""
-        temp_dir = Path(tempfile.mkdtemp())
-        (temp_dir / "build").mkdir(parents=True)
-        (temp_dir / "vault" / "80_Reports").mkdir(parents=True)
-
         storygraph = {
             "version": "1.0",
             "project_id": "minimal",
@@ -491,23 +483,16 @@ class TestValidationWithMinimalData:
             "edges": [],
             "evidence_index": {},
         }
-        (temp_dir / "build" / "storygraph.json").write_text(json.dumps(storygraph))
+        temp_dir = write_project(tmp_path, storygraph)
 
-        try:
-            orchestrator = ValidationOrchestrator(temp_dir)
-            result = orchestrator.run_validation()
+        orchestrator = ValidationOrchestrator(temp_dir)
+        result = orchestrator.run_validation()
 
-            assert "success" in result
-            assert isinstance(result["total_issues"], int)
-        finally:
-            shutil.rmtree(temp_dir)
+        assert "success" in result
+        assert isinstance(result["total_issues"], int)
 
-    def test_validation_with_no_characters(self):
+    def test_validation_with_no_characters(self, tmp_path):
         """Test validation with no characters."""
-        temp_dir = Path(tempfile.mkdtemp())
-        (temp_dir / "build").mkdir(parents=True)
-        (temp_dir / "vault" / "80_Reports").mkdir(parents=True)
-
         storygraph = {
             "version": "1.0",
             "project_id": "no-chars",
@@ -518,26 +503,19 @@ class TestValidationWithMinimalData:
             "edges": [],
             "evidence_index": {},
         }
-        (temp_dir / "build" / "storygraph.json").write_text(json.dumps(storygraph))
+        temp_dir = write_project(tmp_path, storygraph)
 
-        try:
-            orchestrator = ValidationOrchestrator(temp_dir)
-            result = orchestrator.run_validation()
+        orchestrator = ValidationOrchestrator(temp_dir)
+        result = orchestrator.run_validation()
 
-            assert "success" in result
-        finally:
-            shutil.rmtree(temp_dir)
+        assert "success" in result
 
 
 class TestValidatorErrorHandling:
     """Tests for error handling in validators."""
 
-    def test_missing_entity_type_handled(self):
+    def test_missing_entity_type_handled(self, tmp_path):
         """Test that missing entity types don't crash validation."""
-        temp_dir = Path(tempfile.mkdtemp())
-        (temp_dir / "build").mkdir(parents=True)
-        (temp_dir / "vault" / "80_Reports").mkdir(parents=True)
-
         storygraph = {
             "version": "1.0",
             "project_id": "missing-types",
@@ -547,23 +525,16 @@ class TestValidatorErrorHandling:
             "edges": [],
             "evidence_index": {},
         }
-        (temp_dir / "build" / "storygraph.json").write_text(json.dumps(storygraph))
+        temp_dir = write_project(tmp_path, storygraph)
 
-        try:
-            orchestrator = ValidationOrchestrator(temp_dir)
-            result = orchestrator.run_validation()
+        orchestrator = ValidationOrchestrator(temp_dir)
+        result = orchestrator.run_validation()
 
-            # Should complete without crashing
-            assert "success" in result
-        finally:
-            shutil.rmtree(temp_dir)
+        # Should complete without crashing
+        assert "success" in result
 
-    def test_malformed_edges_handled(self):
+    def test_malformed_edges_handled(self, tmp_path):
         """Test that malformed edges don't crash validation."""
-        temp_dir = Path(tempfile.mkdtemp())
-        (temp_dir / "build").mkdir(parents=True)
-        (temp_dir / "vault" / "80_Reports").mkdir(parents=True)
-
         storygraph = {
             "version": "1.0",
             "project_id": "bad-edges",
@@ -576,13 +547,10 @@ class TestValidatorErrorHandling:
             ],
             "evidence_index": {},
         }
-        (temp_dir / "build" / "storygraph.json").write_text(json.dumps(storygraph))
+        temp_dir = write_project(tmp_path, storygraph)
 
-        try:
-            orchestrator = ValidationOrchestrator(temp_dir)
-            result = orchestrator.run_validation()
+        orchestrator = ValidationOrchestrator(temp_dir)
+        result = orchestrator.run_validation()
 
-            # Should complete without crashing
-            assert "success" in result
-        finally:
-            shutil.rmtree(temp_dir)
+        # Should complete without crashing
+        assert "success" in result
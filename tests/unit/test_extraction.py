@@ -266,6 +266,14 @@ Sarah waits.
         boundaries = extractor.detect_boundaries(content)
         assert len(boundaries) >= 2  # At least 2 sluglines + 1 transition
 
+    def test_detect_boundaries_block_ref_from_skipped_line(self, extractor):
+        """Block refs on non-scene lines still carry to the next boundary."""
+        content = "Fox enters. ^ev_a1b2\nint. diner - night\n"
+        boundaries = extractor.detect_boundaries(content)
+        assert len(boundaries) == 1
+        assert boundaries[0].block_ref == "ev_a1b2"
+        assert boundaries[0].context == content
+
 
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
@@ -52,6 +52,22 @@ class TestIssueDataModel:
         assert issue.resolved is False
         assert issue.auto_fixable is False
 
+    def test_issue_severity_rank(self):
+        """Test that severity rank orders errors before warnings before info."""
+        ranks = [
+            Issue(
+                issue_id=f"issue_{severity.value}",
+                category=IssueCategory.TIMELINE,
+                severity=severity,
+                rule_code="TIME-01",
+                title="Title",
+                description="Description",
+            ).severity_rank
+            for severity in (IssueSeverity.ERROR, IssueSeverity.WARNING, IssueSeverity.INFO)
+        ]
+
+        assert ranks == [0, 1, 2]
+
     def test_issue_to_dict(self):
         """Test serialization to dictionary."""
         issue = Issue(
@@ -260,6 +276,25 @@ class TestBaseValidator:
 
         assert entity is None
 
+    def test_entity_index_keeps_first_duplicate_id(self, temp_build_path):
+        """Duplicate IDs resolve to the first entity in the storygraph."""
+        storygraph_path = temp_build_path / "storygraph.json"
+        storygraph = json.loads(storygraph_path.read_text())
+        storygraph["entities"].append(
+            {"id": "CHAR_Fox_001", "type": "character", "name": "Fox Duplicate"}
+        )
+        storygraph_path.write_text(json.dumps(storygraph))
+
+        class TestValidator(BaseValidator):
+            def validate(self):
+                return []
+
+        validator = TestValidator(temp_build_path)
+
+        assert validator.get_entity_by_id("CHAR_Fox_001")["name"] == "Fox"
+        names = [c["name"] for c in validator.get_entities_by_type("character")]
+        assert names == ["Fox", "Fox Duplicate"]
+
     def test_get_scenes_sorted(self, temp_build_path):
         """Test getting scenes sorted by number."""
 
@@ -273,6 +308,36 @@ class TestBaseValidator:
         assert len(scenes) == 1
         assert scenes[0]["attributes"]["scene_number"] == 1
 
+    def test_scene_text_index(self, temp_build_path):
+        """Test paragraph text is indexed by scene, in or out of order."""
+
+        class TestValidator(BaseValidator):
+            def validate(self):
+                self._load_graphs()
+                return []
+
+        scriptgraph_path = temp_build_path / "scriptgraph.json"
+        validator = TestValidator(temp_build_path)
+
+        scriptgraph_path.write_text(json.dumps({"paragraphs": [
+            {"scene_id": "scene_001", "text": "FOX enters."},
+            {"scene_id": "scene_001", "text": "FOX sits."},
+            {"scene_id": "scene_002", "text": "Rain falls."},
+        ]}))
+        validator.validate()
+        assert validator._scene_text == {
+            "scene_001": "FOX enters.\nFOX sits.",
+            "scene_002": "Rain falls.",
+        }
+
+        scriptgraph_path.write_text(json.dumps({"paragraphs": [
+            {"scene_id": "scene_001", "text": "FOX enters."},
+            {"scene_id": "scene_002", "text": "Rain falls."},
+            {"scene_id": "scene_001", "text": "FOX sits."},
+        ]}))
+        validator.validate()
+        assert validator._scene_text["scene_001"] == "FOX enters.\nFOX sits."
+
     def test_create_issue_id(self, temp_build_path):
         """Test issue ID generation."""
 
@@ -408,6 +473,24 @@ class TestWardrobeValidator:
         for issue in issues:
             assert issue.rule_code in valid_codes
 
+    def test_time_marker_whole_word_leftmost(self, temp_build_path):
+        """Test that time markers match whole words, first in the text."""
+        validator = WardrobeValidator(temp_build_path)
+
+        assert validator._extract_time_marker("Moments later, Fox runs.") == "MOMENTS LATER"
+        assert validator._extract_time_marker("A lateral move. Later...") == "LATER"
+        assert validator._extract_time_marker("A lateral move.") is None
+
+    def test_time_marker_only_at_scene_head(self, temp_build_path):
+        """Test that time markers deep in the scene body are ignored."""
+        validator = WardrobeValidator(temp_build_path)
+        limit = WardrobeValidator.TIME_MARKER_SCAN_CHARS
+
+        assert validator._extract_time_marker("x" * (limit + 10) + " LATER") is None
+        # A marker starting inside the limit is matched whole
+        assert validator._extract_time_marker("x" * (limit - 3) + " MOMENTS LATER") == "MOMENTS LATER"
+        assert validator._extract_time_marker("x" * (limit - 3) + " LATERAL") is None
+
 
 class TestPropsValidator:
     """Tests for PropsValidator."""
@@ -555,6 +638,59 @@ class TestTimelineValidator:
         for issue in issues:
             assert issue.rule_code in valid_codes
 
+    def test_location_distances_case_insensitive(self, temp_build_path):
+        """Test that distance keys match scene locations regardless of case."""
+        storygraph = {
+            "entities": [
+                {"id": "CHAR_Fox_001", "type": "character", "name": "Fox"},
+                {
+                    "id": "scene_001",
+                    "type": "scene",
+                    "characters": ["CHAR_Fox_001"],
+                    "attributes": {"scene_number": 1, "location": "diner"},
+                },
+                {
+                    "id": "scene_002",
+                    "type": "scene",
+                    "characters": ["CHAR_Fox_001"],
+                    "attributes": {"scene_number": 2, "location": "OFFICE"},
+                },
+            ],
+        }
+        (temp_build_path / "storygraph.json").write_text(json.dumps(storygraph))
+
+        validator = TimelineValidator(
+            temp_build_path, location_distances={("Diner", "Office"): 45}
+        )
+        issues = validator.validate()
+
+        assert [i.rule_code for i in issues] == ["TIME-01"]
+        assert issues[0].scene_id == "scene_002"
+
+    def test_time_marker_is_leftmost_in_text(self, temp_build_path):
+        """Test that the first marker in the text is reported, longest first."""
+        validator = TimelineValidator(temp_build_path)
+
+        assert validator._extract_time_marker("Moments later, Fox runs.") == "MOMENTS LATER"
+        assert validator._extract_time_marker("THE NEXT DAY. Later...") == "THE NEXT DAY"
+        assert validator._extract_time_marker("Fox sits alone.") is None
+
+    def test_simultaneous_groups_include_anchor_scene(self, temp_build_path):
+        """Test that continuous runs are grouped with the preceding scene."""
+        validator = TimelineValidator(temp_build_path)
+        markers = ["CONTINUOUS", "MEANWHILE", None, "LATER", "CONTINUOUS"]
+        timeline = [
+            {"scene_id": f"scene_{n:03d}", "time_marker": marker}
+            for n, marker in enumerate(markers, start=1)
+        ]
+
+        groups = validator._find_simultaneous_scenes(timeline)
+
+        assert [[s["scene_id"] for s in g] for g, _ in groups] == [
+            ["scene_001", "scene_002"],
+            ["scene_004", "scene_005"],
+        ]
+
 
 class TestKnowledgeValidator:
     """Tests for KnowledgeValidator."""
@@ -9,7 +9,7 @@ from core.vault import (
     render_location_template,
     render_scene_template,
 )
-from core.vault.templates import _slugify
+from core.vault.templates import _slugify, format_yaml_value
 
 
 @pytest.fixture
@@ -80,6 +80,22 @@ class TestSlugify:
         """Test slugification strips spaces."""
         assert _slugify("  John Smith  ") == "john-smith"
 
+    def test_idempotent(self):
+        """Test that slugifying a slug leaves it unchanged."""
+        for name in ["John Smith", "Mr. O'Brien", "Café Noir", "JOHN   SMITH"]:
+            assert _slugify(_slugify(name)) == _slugify(name)
+
+
+class TestFormatYamlValue:
+    """Tests for YAML frontmatter value formatting."""
+
+    def test_list_round_trips_through_yaml(self):
+        """Test that list items survive quotes, backslashes and newlines."""
+        import yaml
+        value = ["O'Brien", 'say "hi"', "back\\slash", "two\nlines"]
+
+        assert yaml.safe_load(f"x: {format_yaml_value(value)}")["x"] == value
+
 
 class TestCharacterTemplate:
     """Tests for character template rendering."""
@@ -119,6 +135,21 @@ class TestCharacterTemplate:
 
         assert "*None recorded*" in content
 
+    def test_character_frontmatter_round_trips_aliases(self):
+        """Test that quotes, colons and backslashes survive the frontmatter."""
+        from core.sync.reingest import extract_frontmatter
+        entity = {
+            "id": "CHAR_003",
+            "name": "Conan O'Brien",
+            "type": "character",
+            "aliases": ["O'Brien: \"Jr\"", "back\\slash"],
+            "evidence_ids": [],
+        }
+        frontmatter = extract_frontmatter(render_character_template(entity, ""))
+
+        assert frontmatter["name"] == "Conan O'Brien"
+        assert frontmatter["aliases"] == ["O'Brien: \"Jr\"", "back\\slash"]
+
     def test_protected_block_markers_character(self, sample_character):
         """Verify protected block markers present in character template."""
         content = render_character_template(sample_character, "")
@@ -232,6 +263,26 @@ class TestEvidenceLinkFormatting:
         assert "[[inbox/script#^ev_001]]" in links
         assert "[[inbox/script#^ev_002]]" in links
 
+    def test_evidence_index_shared_across_writers(self, tmp_path):
+        """Test that writers on the same build share one parsed index until it changes."""
+        import json
+        import os
+        build_path = tmp_path / "build"
+        build_path.mkdir()
+        index_path = build_path / "evidence_index.json"
+        index_path.write_text(json.dumps({"evidence": {"ev_001": {"source_path": "a"}}}))
+
+        first = VaultNoteWriter(tmp_path / "vault", build_path)
+        second = VaultNoteWriter(tmp_path / "vault", build_path)
+        assert first._load_evidence_index() is second._load_evidence_index()
+
+        # A rewritten index is parsed again by new writers
+        index_path.write_text(json.dumps({"evidence": {"ev_001": {"source_path": "bb"}}}))
+        stat = index_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = VaultNoteWriter(tmp_path / "vault", build_path)
+        assert third.format_evidence_links(["ev_001"]) == "- [[bb#^ev_001]]"
+
     def test_evidence_link_empty_list(self, tmp_path):
         """Test formatting with empty evidence list."""
         writer = VaultNoteWriter(tmp_path)
@@ -251,6 +302,18 @@ class TestVaultNoteWriter:
         assert (tmp_path / "20_Locations").exists()
         assert (tmp_path / "50_Scenes").exists()
 
+    def test_write_recreates_removed_directory(self, tmp_path, sample_character):
+        """Test that a note directory removed after init is created again."""
+        import shutil
+        VaultNoteWriter(tmp_path)
+        shutil.rmtree(tmp_path / "10_Characters")
+
+        # Directory creation is skipped for an already-initialized vault
+        writer = VaultNoteWriter(tmp_path)
+        result = writer.write_character(sample_character)
+
+        assert result.exists()
+
     def test_write_character_creates_file(self, tmp_path, sample_character):
         """Integration test that file is created in correct dir."""
         writer = VaultNoteWriter(tmp_path)
@@ -337,3 +400,47 @@ class TestVaultNoteWriter:
         unknown_entity = {"id": "TEST", "type": "unknown"}
         result = writer.write_entity(unknown_entity)
         assert result is None
+
+    def test_write_entities_batch(self, tmp_path, sample_character, sample_location, sample_scene):
+        """Test batch writing returns paths in input order."""
+        writer = VaultNoteWriter(tmp_path)
+        renamed = dict(sample_character, id="CHAR_002", aliases=[])
+        unknown_entity = {"id": "TEST", "type": "unknown"}
+
+        paths = writer.write_entities(
+            [sample_character, sample_location, unknown_entity, sample_scene, renamed]
+        )
+
+        assert paths[0] == paths[4] == tmp_path / "10_Characters" / "john-smith.md"
+        assert paths[1] == tmp_path / "20_Locations" / "coffee-shop.md"
+        assert paths[2] is None
+        assert paths[3] == tmp_path / "50_Scenes" / "SCN_001.md"
+        # Entities sharing a note file are applied in order: the first creates
+        # the note, the second (no aliases) replaces its protected block
+        content = paths[0].read_text()
+        assert "id: CHAR_001" in content
+        assert "- Johnny" not in content
+
+    def test_write_entities_skip_errors(self, tmp_path, sample_character):
+        """Test that a failing entity yields None when skip_errors is set."""
+        writer = VaultNoteWriter(tmp_path)
+        broken = {"id": "CHAR_002", "type": "character", "name": None}
+
+        with pytest.raises(AttributeError):
+            writer.write_entities([broken, sample_character])
+
+        paths = writer.write_entities([broken, sample_character], skip_errors=True)
+        assert paths[0] is None
+        assert paths[1] == tmp_path / "10_Characters" / "john-smith.md"
+
+    def test_unchanged_note_not_rewritten(self, tmp_path, sample_character):
+        """Test that rewriting an unchanged entity leaves the file untouched."""
+        import os
+
+        writer = VaultNoteWriter(tmp_path)
+        path = writer.write_character(sample_character)
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        writer.write_character(sample_character)
+
+        assert path.stat().st_mtime_ns == 1_000_000_000